@@ -1,13 +1,24 @@
 import builtins
+import dataclasses
+import functools
+import os
+import re
 import typing
 from types import EllipsisType, NoneType
 from typing import Annotated
 from typing import Any
 from typing import Any as _Ignore
 from typing import (
+    Callable,
+    Dict,
     Final,
+    Hashable,
     Iterable,
+    Iterator,
+    List,
+    Literal,
     Mapping,
+    NamedTuple,
     Sequence,
     Tuple,
     Type,
@@ -16,6 +27,12 @@ from typing import (
 )
 
 
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+
 # ################################ PACKAGE #####################################
 
 
@@ -29,7 +46,12 @@ __requires__ = ()
 __all__ = (
     # fmt: off
     "isnone", "isbool", "isfalse", "istrue",
-    "resolve",
+    "register",
+    "resolve", "compile", "resolve_many",
+    "environ",
+    "dumps",
+    "cache_info", "clear_caches", "resize_cache",
+    "ResolveError",
     # fmt: on
 )
 
@@ -46,6 +68,58 @@ _UNSET: Final = object()
 T = TypeVar("T")
 
 
+_Parser = Callable[[str], Any]
+
+_Encoder = Callable[[Any], str]
+
+_Context = Literal["top", "item", "key"]
+
+
+# ################################ TYPES #######################################
+
+
+class _Tokens(NamedTuple):
+    source: str
+    closes: Dict[int, int]
+    """Index of each opening grouping character -> index of its closing one."""
+    groups: Dict[int, List[int]]
+    """
+    Index of each opening grouping character (or `-1` for the top level)
+    -> indices of the opening grouping characters directly enclosed by it.
+    """
+    balanced: bool
+
+
+class _Kind(NamedTuple):
+    mapped: Type[Any]
+    """Type of the mapped value of a token (`object` if none)."""
+    numeric: bool
+    """Whether `int`, `float` or `complex` may accept the string."""
+    sequence: bool
+    """Whether the string is enclosed by sequence delimiters."""
+    mapping: bool
+    """Whether the string is enclosed by mapping delimiters."""
+
+
+# Tokens of a source string and the offset of a substring within it.
+_Span = Tuple[_Tokens, int]
+
+_Item = Tuple[str, _Span | None]
+
+
+# ################################ EXCEPTIONS ##################################
+
+
+class ResolveError(ValueError):
+    def __init__(self, errors: Mapping[int, ValueError]) -> None:
+        super().__init__(
+            "invalid strings at indices: "
+            + str.join(", ", map(str, errors))
+            # <format-break>
+        )
+        self.errors = errors
+
+
 # ################################ COSTANTS ####################################
 
 
@@ -53,8 +127,20 @@ NONE_MAPPED_VALUES: Final = ("none", "null", "invalid")
 FALSE_MAPPED_VALUES: Final = ("false", "no", "off", "disable", "disabled")
 TRUE_MAPPED_VALUES: Final = ("true", "yes", "on", "enable", "enabled")
 
+# Lower case token -> mapped value (see `register`).
+MAPPED_VALUES: Final = {
+    **dict.fromkeys(NONE_MAPPED_VALUES, None),
+    **dict.fromkeys(FALSE_MAPPED_VALUES, False),
+    **dict.fromkeys(TRUE_MAPPED_VALUES, True),
+}
+
 INT_BASE_INDICATORS: Final = {"b": 2, "o": 8, "x": 16}
 
+# Leading characters (besides decimal digits and whitespace) of strings that
+# `int`, `float` or `complex` may accept, e.g. "-1", ".5", "inf", "nan", "j"
+# or "(1+2j)".
+NUMERIC_LEADING_CHARS: Final = frozenset("+-.(iInNjJ")
+
 SEQUENCE_DELIMITERS: Final = ("()", "[]")
 SEQUENCE_SEPARATOR: Final = ","
 
@@ -64,6 +150,8 @@ MAPPING_DIVIDER: Final = ":"
 
 GROUPINGS: Final = {k: v for k, v in ("()", "[]", "{}", "''", '""')}
 
+RESOLVE_CACHE_MAXSIZE: Final = 1024
+
 
 # ################################ FUNCTIONS ###################################
 
@@ -79,7 +167,7 @@ def isnone(
         return none
     elif not s:
         return empty
-    return s.lower() in NONE_MAPPED_VALUES
+    return _mapped(s) is None
 
 
 def isbool(
@@ -93,11 +181,7 @@ def isbool(
         return none
     elif not s:
         return empty
-    return (
-        s.lower() in FALSE_MAPPED_VALUES
-        or s.lower() in TRUE_MAPPED_VALUES
-        # <format-newline>
-    )
+    return isinstance(_mapped(s), bool)
 
 
 def isfalse(
@@ -111,7 +195,7 @@ def isfalse(
         return none
     elif not s:
         return empty
-    return s.lower() in FALSE_MAPPED_VALUES
+    return _mapped(s) is False
 
 
 def istrue(
@@ -125,7 +209,22 @@ def istrue(
         return none
     elif not s:
         return empty
-    return s.lower() in TRUE_MAPPED_VALUES
+    return _mapped(s) is True
+
+
+# ###################### REGISTER ##########################
+
+
+def register(
+    *tokens: str,
+    value: bool | None,
+) -> None:
+    global _mappedlength
+    for token in tokens:
+        MAPPED_VALUES[token.lower()] = value
+    _mappedlength = max(map(len, MAPPED_VALUES))
+    # Cached results of the registered tokens would be stale otherwise.
+    clear_caches()
 
 
 # ###################### RESOLVE ###########################
@@ -135,6 +234,8 @@ def istrue(
 def resolve(
     s: str,
     /,
+    *,
+    cache: bool = ...,
 ) -> Any: ...
 
 
@@ -143,6 +244,8 @@ def resolve(
     s: str,
     /,
     type: None,
+    *,
+    cache: bool = ...,
 ) -> None: ...
 
 
@@ -151,6 +254,8 @@ def resolve(
     s: str,
     /,
     type: Type[T],
+    *,
+    cache: bool = ...,
 ) -> T: ...
 
 
@@ -159,6 +264,8 @@ def resolve(
     s: str,
     /,
     type: Any,
+    *,
+    cache: bool = ...,
 ) -> Any: ...
 
 
@@ -166,10 +273,175 @@ def resolve(
     s: str,
     /,
     type: Any = _UNSET,
+    *,
+    cache: bool = False,
 ) -> _Ignore:
+    if cache:
+        key = _typekey(type)
+        try:
+            hash((type, key))
+        except TypeError:
+            # Unhashable types are resolved without the cache.
+            pass
+        else:
+            return _copy(_cachedresolve(s, type, key))
     return _resolve.call(s, type, _depth=0)
 
 
+# ###################### CACHE #############################
+
+
+def cache_info() -> functools._CacheInfo:
+    return _cachedresolve.cache_info()
+
+
+def clear_caches() -> None:
+    _cachedresolve.cache_clear()
+
+
+def resize_cache(maxsize: int | None) -> None:
+    global _cachedresolve
+    _cachedresolve = functools.lru_cache(maxsize=maxsize)(_uncachedresolve)
+
+
+# ###################### COMPILE ###########################
+
+
+@overload
+def compile(
+    type: None,
+    /,
+) -> Callable[[str], None]: ...
+
+
+@overload
+def compile(
+    type: Type[T],
+    /,
+) -> Callable[[str], T]: ...
+
+
+@overload
+def compile(
+    type: Any = ...,
+    /,
+) -> Callable[[str], Any]: ...
+
+
+def compile(
+    type: Any = _UNSET,
+    /,
+) -> _Parser:
+    return _compile.call(type, 0)
+
+
+# ###################### RESOLVE MANY ######################
+
+
+@overload
+def resolve_many(
+    strings: Iterable[str],
+    /,
+) -> Sequence[Any]: ...
+
+
+@overload
+def resolve_many(
+    strings: Iterable[str],
+    /,
+    type: Type[T],
+) -> Sequence[T]: ...
+
+
+@overload
+def resolve_many(
+    strings: Iterable[str],
+    /,
+    type: Any,
+) -> Sequence[Any]: ...
+
+
+def resolve_many(
+    strings: Iterable[str],
+    /,
+    type: Any = _UNSET,
+) -> Sequence[_Ignore]:
+    strings = (
+        strings
+        if isinstance(strings, Sequence)
+        else list(strings)
+        # <format-break>
+    )
+
+    columnar = numpy is not None and (
+        type is int or type is float or type is bool
+    )
+    if columnar:
+        try:
+            return _resolvecolumn(strings, type)
+        except (ValueError, OverflowError):
+            pass
+
+    parser = compile(type)
+
+    values, errors = list[Any](), dict[int, ValueError]()
+    for index, s in enumerate(strings):
+        try:
+            values.append(parser(s))
+        except ValueError as exc:
+            errors[index] = exc
+        except IndexError as exc:
+            # Empty strings fail on their first character (e.g. empty cells).
+            errors[index] = ValueError(f"invalid string: {s!r}")
+            errors[index].__cause__ = exc
+
+    if errors:
+        raise ResolveError(errors)
+
+    return numpy.array(values) if columnar else values
+
+
+# ###################### ENVIRON ###########################
+
+
+def environ(
+    schema: Type[T],
+    /,
+    *,
+    prefix: str = "",
+    source: Mapping[str, str] | None = None,
+) -> T:
+    source = os.environ if source is None else source
+
+    values = dict[str, Any]()
+    for field, name, parser, required in _environfields(schema, prefix):
+        s = source.get(name, None)
+        if s is None:
+            if required:
+                raise KeyError(name)
+            continue
+        try:
+            values[field] = parser(s)
+        except (IndexError, ValueError) as exc:
+            # Empty strings fail on their first character (e.g. "VAR=").
+            raise ValueError(f"invalid {name}: {s!r}") from exc
+
+    if dataclasses.is_dataclass(schema):
+        return schema(**values)
+    return values  # type: ignore
+
+
+# ###################### DUMPS #############################
+
+
+def dumps(
+    value: Any,
+    /,
+    type: Any = _UNSET,
+) -> str:
+    return _encode.call(type, "top")(value)
+
+
 # ################################ INTERNALS ###################################
 
 
@@ -202,52 +474,55 @@ class _resolve:
         /,
         *,
         _depth: int,
+        _at: _Span | None = None,
     ) -> _Ignore:
-        if s.lower() in NONE_MAPPED_VALUES:
-            return None
-
-        if s.lower() in FALSE_MAPPED_VALUES:
-            return False
-        if s.lower() in TRUE_MAPPED_VALUES:
-            return True
+        value = _mapped(s)
+        if value is not _UNSET:
+            return value
+
+        sfirst = s[:1]
+        if (
+            sfirst in NUMERIC_LEADING_CHARS
+            or sfirst.isdecimal()
+            or sfirst.isspace()
+        ) and not (_at is not None and _spannested(s, _at)):
+            intbase = INT_BASE_INDICATORS.get(s[1:2], 10)
+            try:
+                return int(s, intbase)
+            except ValueError:
+                pass
 
-        intbase = INT_BASE_INDICATORS.get(s[1:2], 10)
-        try:
-            return int(s, intbase)
-        except ValueError:
-            pass
+            try:
+                return float(s)
+            except ValueError:
+                pass
 
-        try:
-            return float(s)
-        except ValueError:
-            pass
+            try:
+                return complex(s)
+            except ValueError:
+                pass
 
-        try:
-            return complex(s)
-        except ValueError:
-            pass
+        sfirst, slast = s[0], s[-1]
 
-        try:
-            _mapping = _resolve.mapping(s)
-        except ValueError:
-            pass
-        else:
+        if (sfirst + slast) in MAPPING_DELIMITERS:
             return dict(
                 (
-                    _resolve.auto(keystr, _depth=(_depth + 1)),
-                    _resolve.auto(valuestr, _depth=(_depth + 1)),
+                    _resolve.auto(keystr, _depth=(_depth + 1), _at=keyat),
+                    _resolve.auto(valuestr, _depth=(_depth + 1), _at=valueat),
+                )
+                for (keystr, keyat), (valuestr, valueat) in _resolve.pairs(
+                    s, _at=_at
                 )
-                for keystr, valuestr in _mapping
             )
 
-        try:
-            _sequence = _resolve.sequence(s, nodelim=(_depth == 0))
-        except ValueError:
-            pass
-        else:
+        if (sfirst + slast) in SEQUENCE_DELIMITERS or (
+            _depth == 0 and SEQUENCE_SEPARATOR in s
+        ):
             return list(
-                _resolve.auto(itemstr, _depth=(_depth + 1))
-                for itemstr in _sequence  # <format-break>
+                _resolve.auto(itemstr, _depth=(_depth + 1), _at=itemat)
+                for itemstr, itemat in _resolve.items(
+                    s, nodelim=(_depth == 0), _at=_at
+                )
             )
 
         return s
@@ -258,8 +533,8 @@ class _resolve:
         /,
         type: Any,
     ) -> _Ignore:
-        if type is None:
-            if s.lower() in NONE_MAPPED_VALUES:
+        if type is None or type is NoneType:
+            if _mapped(s) is None:
                 return None
             raise ValueError(f"invalid none: {s!r}")
 
@@ -267,10 +542,9 @@ class _resolve:
             return str(s)
 
         elif type is bool:
-            if s.lower() in FALSE_MAPPED_VALUES:
-                return False
-            elif s.lower() in TRUE_MAPPED_VALUES:
-                return True
+            value = _mapped(s)
+            if isinstance(value, bool):
+                return value
             raise ValueError(f"invalid bool: {s!r}")
 
         elif type is int:
@@ -302,6 +576,13 @@ class _resolve:
             return _resolve.call(s, anntype, _depth=(_depth + 1))
 
         elif origin is typing.Union:
+            try:
+                parser = _compile.call(type, _depth)
+            except TypeError:
+                pass
+            else:
+                return parser(s)
+
             for itemtype in typing.get_args(type):
                 try:
                     return _resolve.call(s, itemtype, _depth=(_depth + 1))
@@ -345,6 +626,10 @@ class _resolve:
 
         raise ValueError(s, origin, type)
 
+    # Typed parsers only split the items of one level each, which plain
+    # splitting does fastest; the token structure only pays off when it is
+    # reused across levels (see `_resolve.items`).
+
     @staticmethod
     def sequence(
         s: str,
@@ -352,23 +637,11 @@ class _resolve:
         *,
         nodelim: bool,
     ) -> Iterable[str]:
-        sfirst, slast = s[0], s[-1]
-        for ldelim, rdelim in SEQUENCE_DELIMITERS:
-            if sfirst == ldelim and slast == rdelim:
-                unpack = 1
-                break
-        else:
-            if nodelim and slast == SEQUENCE_SEPARATOR:
-                unpack = -1
-            elif nodelim and SEQUENCE_SEPARATOR in s:
-                unpack = 0
-            else:
-                raise ValueError(f"invalid sequence: {s!r}")
         return _split(
             s,
             SEQUENCE_SEPARATOR,
             grouping=GROUPINGS,
-            unpack=unpack,
+            unpack=_resolve.sequenceunpack(s, nodelim=nodelim),
         )
 
     @staticmethod
@@ -376,27 +649,662 @@ class _resolve:
         s: str,
         /,
     ) -> Iterable[Tuple[str, str]]:
-        sfirst, slast = s[0], s[-1]
-        for ldelim, rdelim in MAPPING_DELIMITERS:
-            if sfirst == ldelim and slast == rdelim:
-                unpack = 1
-                break
-        else:
-            raise ValueError(f"invalid mapping: {s!r}")
         return (
             _partition(itemstr, MAPPING_DIVIDER)
             for itemstr in _split(
                 s,
                 MAPPING_SEPARATOR,
                 grouping=GROUPINGS,
-                unpack=unpack,
+                unpack=_resolve.mappingunpack(s),
+            )
+        )
+
+    @staticmethod
+    def items(
+        s: str,
+        /,
+        *,
+        nodelim: bool,
+        _at: _Span | None = None,
+    ) -> Iterable[_Item]:
+        return _spansplit(
+            s,
+            SEQUENCE_SEPARATOR,
+            grouping=GROUPINGS,
+            unpack=_resolve.sequenceunpack(s, nodelim=nodelim),
+            _at=_at,
+        )
+
+    @staticmethod
+    def pairs(
+        s: str,
+        /,
+        *,
+        _at: _Span | None = None,
+    ) -> Iterable[Tuple[_Item, _Item]]:
+        return (
+            _spanpartition(itemstr, MAPPING_DIVIDER, _at=itemat)
+            for itemstr, itemat in _spansplit(
+                s,
+                MAPPING_SEPARATOR,
+                grouping=GROUPINGS,
+                unpack=_resolve.mappingunpack(s),
+                _at=_at,
+            )
+        )
+
+    @staticmethod
+    def sequenceunpack(
+        s: str,
+        /,
+        *,
+        nodelim: bool,
+    ) -> int:
+        sfirst, slast = s[0], s[-1]
+        for ldelim, rdelim in SEQUENCE_DELIMITERS:
+            if sfirst == ldelim and slast == rdelim:
+                return 1
+        if nodelim and slast == SEQUENCE_SEPARATOR:
+            return -1
+        elif nodelim and SEQUENCE_SEPARATOR in s:
+            return 0
+        raise ValueError(f"invalid sequence: {s!r}")
+
+    @staticmethod
+    def mappingunpack(
+        s: str,
+        /,
+    ) -> int:
+        sfirst, slast = s[0], s[-1]
+        for ldelim, rdelim in MAPPING_DELIMITERS:
+            if sfirst == ldelim and slast == rdelim:
+                return 1
+        raise ValueError(f"invalid mapping: {s!r}")
+
+
+class _compile:
+
+    @staticmethod
+    def call(
+        type: _Ignore,
+        _depth: int,
+        /,
+    ) -> _Parser:
+        return _compile.cached(type, _typekey(type), _depth)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def cached(
+        type: _Ignore,
+        _key: Hashable,
+        _depth: int,
+        /,
+    ) -> _Parser:
+        if type is _UNSET or type is Any:
+            return functools.partial(_resolve.auto, _depth=_depth)
+
+        origin = typing.get_origin(type)
+        if origin is None:
+            return _compile.primitive(type)
+        else:
+            return _compile.origin(origin, type, _depth)
+
+    @staticmethod
+    def primitive(  # noqa: C901
+        type: Any,
+        /,
+    ) -> _Parser:
+        if type is None or type is NoneType:
+
+            def _none(s: str, /) -> None:
+                if _mapped(s) is None:
+                    return None
+                raise ValueError(f"invalid none: {s!r}")
+
+            return _none
+
+        elif type is str:
+            return str
+
+        elif type is bool:
+
+            def _bool(s: str, /) -> bool:
+                value = _mapped(s)
+                if isinstance(value, bool):
+                    return value
+                raise ValueError(f"invalid bool: {s!r}")
+
+            return _bool
+
+        elif type is int:
+
+            def _int(s: str, /) -> int:
+                return int(s, INT_BASE_INDICATORS.get(s[1:2], 10))
+
+            return _int
+
+        elif type is float:
+            return float
+
+        elif type is complex:
+            return complex
+
+        elif type is bytes:
+            return functools.partial(bytes, encoding="utf-8")
+
+        raise ValueError(f"invalid type: {type!r}")
+
+    @staticmethod
+    def origin(  # noqa: C901
+        origin: Any,
+        type: Any,
+        _depth: int,
+        /,
+    ) -> _Parser:
+        nodelim = _depth == 0
+        sequence, mapping = _resolve.sequence, _resolve.mapping
+
+        if origin is typing.Annotated:
+            (anntype, *_) = typing.get_args(type)
+            return _compile.call(anntype, _depth + 1)
+
+        elif origin is typing.Union:
+            _items = list[Tuple[_Parser, Callable[[_Kind], bool]]]()
+            for itemtype in typing.get_args(type):
+                try:
+                    _items.append(
+                        (
+                            _compile.call(itemtype, _depth + 1),
+                            _compile.accepts(itemtype),
+                        )
+                    )
+                except ValueError:
+                    continue
+            items = tuple(_items)
+
+            # Member parsers that may accept strings of a kind, in order.
+            plans = dict[_Kind | None, Tuple[_Parser, ...]]()
+
+            def _union(s: str, /) -> Any:
+                kind = _kind(s) if s else None
+                try:
+                    itemparsers = plans[kind]
+                except KeyError:
+                    itemparsers = plans[kind] = tuple(
+                        itemparser
+                        for itemparser, accepts in items
+                        if kind is None or accepts(kind)
+                    )
+                for itemparser in itemparsers:
+                    try:
+                        return itemparser(s)
+                    except ValueError:
+                        continue
+                raise ValueError(s, origin, type)
+
+            return _union
+
+        elif issubclass(origin, typing.Tuple):
+            _itemtypes = typing.get_args(type)
+            if Ellipsis in _itemtypes:
+                (itemtype, _) = _itemtypes
+                itemparser = _compile.call(itemtype, _depth + 1)
+                return lambda s: tuple(
+                    map(itemparser, sequence(s, nodelim=nodelim))
+                )
+            else:
+                itemparsers = tuple(
+                    _compile.call(itemtype, _depth + 1)
+                    for itemtype in _itemtypes
+                )
+                return lambda s: tuple(
+                    itemparser(itemstr)
+                    for (itemstr, itemparser) in builtins.zip(
+                        sequence(s, nodelim=nodelim),
+                        itemparsers,
+                        strict=True,
+                    )
+                )
+
+        elif issubclass(origin, typing.List):
+            (itemtype,) = typing.get_args(type)
+            itemparser = _compile.call(itemtype, _depth + 1)
+            return lambda s: list(
+                map(itemparser, sequence(s, nodelim=nodelim))
+            )
+
+        elif issubclass(origin, typing.Dict):
+            (keytype, valuetype) = typing.get_args(type)
+            keyparser = _compile.call(keytype, _depth + 1)
+            valueparser = _compile.call(valuetype, _depth + 1)
+            return lambda s: dict(
+                (keyparser(keystr), valueparser(valuestr))
+                for keystr, valuestr in mapping(s)
+            )
+
+        raise ValueError(origin, type)
+
+    @staticmethod
+    def accepts(  # noqa: C901
+        type: Any,
+        /,
+    ) -> Callable[[_Kind], bool]:
+        origin = typing.get_origin(type)
+
+        if origin is None:
+            if type is None or type is NoneType:
+                return lambda kind: kind.mapped is NoneType
+            elif type is bool:
+                return lambda kind: kind.mapped is bool
+            elif type is int or type is float or type is complex:
+                return lambda kind: kind.numeric
+
+        elif origin is typing.Annotated:
+            (anntype, *_) = typing.get_args(type)
+            return _compile.accepts(anntype)
+
+        elif origin is typing.Union:
+            _accepts = tuple(map(_compile.accepts, typing.get_args(type)))
+            return lambda kind: any(accepts(kind) for accepts in _accepts)
+
+        elif isinstance(origin, builtins.type):
+            if issubclass(origin, (typing.Tuple, typing.List)):
+                return lambda kind: kind.sequence
+            elif issubclass(origin, typing.Dict):
+                return lambda kind: kind.mapping
+
+        return lambda kind: True
+
+
+class _encode:
+
+    @staticmethod
+    def call(
+        type: _Ignore,
+        context: _Context,
+        /,
+    ) -> _Encoder:
+        return _encode.cached(type, _typekey(type), context)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def cached(
+        type: _Ignore,
+        _key: Hashable,
+        context: _Context,
+        /,
+    ) -> _Encoder:
+        if type is _UNSET or type is Any:
+            return _encode.verified(
+                functools.partial(_encode.auto, context=context),
+                functools.partial(
+                    _resolve.auto,
+                    _depth=(0 if context == "top" else 1),
+                ),
+            )
+
+        origin = typing.get_origin(type)
+        if origin is None:
+            return _encode.primitive(type, context)
+        else:
+            return _encode.origin(origin, type, context)
+
+    @staticmethod
+    def auto(value: Any, /, context: _Context) -> str:  # noqa: C901
+        if value is None or isinstance(value, (bool, int, float, complex)):
+            return _encode.primitive(builtins.type(value), "top")(value)
+        elif isinstance(value, str):
+            return _encode.check(context)(value, builtins.type(value), value)
+        elif isinstance(value, list):
+            return _encode.sequence(
+                value,
+                functools.partial(_encode.auto, context="item"),
+            )
+        elif isinstance(value, dict):
+            return _encode.mapping(
+                value,
+                functools.partial(_encode.auto, context="key"),
+                functools.partial(_encode.auto, context="item"),
+            )
+        raise TypeError(f"invalid value: {value!r}")
+
+    @staticmethod
+    def check(context: _Context, /) -> Callable[[Any, Any, str], str]:
+        if context == "top":
+            return _expect
+        elif context == "item":
+            return _expectitem
+        return _expectkey
+
+    @staticmethod
+    def primitive(  # noqa: C901
+        type: Any,
+        context: _Context,
+        /,
+    ) -> _Encoder:
+        if type is None or type is NoneType:
+            return lambda value: _expect(value, NoneType, NONE_MAPPED_VALUES[0])
+
+        elif type is str or type is bytes:
+            check = _encode.check(context)
+            if type is str:
+                return lambda value: check(value, str, value)
+            return lambda value: check(
+                value,
+                bytes,
+                _expect(value, bytes, value).decode("utf-8"),
+            )
+
+        elif type is bool:
+            return lambda value: _expect(
+                value,
+                bool,
+                (TRUE_MAPPED_VALUES[0] if value else FALSE_MAPPED_VALUES[0]),
+            )
+
+        elif type is int:
+            return lambda value: repr(_expect(value, int, value))
+
+        elif type is float:
+            return lambda value: repr(_expect(value, float, value))
+
+        elif type is complex:
+            return lambda value: repr(_expect(value, complex, value))
+
+        raise ValueError(f"invalid type: {type!r}")
+
+    @staticmethod
+    def origin(  # noqa: C901
+        origin: Any,
+        type: Any,
+        context: _Context,
+        /,
+    ) -> _Encoder:
+        if origin is typing.Annotated:
+            (anntype, *_) = typing.get_args(type)
+            return _encode.call(anntype, context)
+
+        elif origin is typing.Union:
+            _itemencoders = list[_Encoder]()
+            for itemtype in typing.get_args(type):
+                try:
+                    _itemencoders.append(_encode.call(itemtype, context))
+                except ValueError:
+                    continue
+            itemencoders = tuple(_itemencoders)
+            parser = _compile.call(type, (0 if context == "top" else 1))
+
+            # Members are tried in order when resolving, so an encoding is
+            # only valid if no preceding member resolves it differently.
+            def _union(value: Any, /) -> str:
+                for itemencoder in itemencoders:
+                    try:
+                        s = itemencoder(value)
+                    except (TypeError, ValueError):
+                        continue
+                    if _lossless(value, s, parser):
+                        return s
+                raise ValueError(f"unrepresentable value: {value!r}")
+
+            return _union
+
+        elif issubclass(origin, typing.Tuple):
+            _itemtypes = typing.get_args(type)
+            if Ellipsis in _itemtypes:
+                (itemtype, _) = _itemtypes
+                itemencoder = _encode.call(itemtype, "item")
+                return lambda value: _encode.sequence(
+                    _expect(value, tuple, value),
+                    itemencoder,
+                )
+            else:
+                itemencoders = tuple(
+                    _encode.call(itemtype, "item")
+                    for itemtype in _itemtypes
+                    # <format-break>
+                )
+                return lambda value: _encode.sequence(
+                    _expect(value, tuple, value),
+                    itemencoders,
+                )
+
+        elif issubclass(origin, typing.List):
+            (itemtype,) = typing.get_args(type)
+            itemencoder = _encode.call(itemtype, "item")
+            return lambda value: _encode.sequence(
+                _expect(value, list, value),
+                itemencoder,
+            )
+
+        elif issubclass(origin, typing.Dict):
+            (keytype, valuetype) = typing.get_args(type)
+            keyencoder = _encode.call(keytype, "key")
+            valueencoder = _encode.call(valuetype, "item")
+            return lambda value: _encode.mapping(
+                _expect(value, dict, value),
+                keyencoder,
+                valueencoder,
+            )
+
+        raise ValueError(origin, type)
+
+    @staticmethod
+    def sequence(
+        value: Sequence[Any],
+        /,
+        itemencoder: _Encoder | Sequence[_Encoder],
+    ) -> str:
+        if not value:
+            raise ValueError(f"unrepresentable empty sequence: {value!r}")
+        if callable(itemencoder):
+            items = map(itemencoder, value)
+        elif len(value) != len(itemencoder):
+            raise ValueError(f"invalid length: {value!r}")
+        else:
+            items = (
+                encoder(item)
+                for (item, encoder) in builtins.zip(value, itemencoder)
             )
+        # Parentheses would be ambiguous with complex numbers (e.g. "(1)").
+        ldelim, rdelim = SEQUENCE_DELIMITERS[1]
+        return ldelim + str.join(SEQUENCE_SEPARATOR, items) + rdelim
+
+    @staticmethod
+    def mapping(
+        value: Mapping[Any, Any],
+        /,
+        keyencoder: _Encoder,
+        valueencoder: _Encoder,
+    ) -> str:
+        if not value:
+            raise ValueError(f"unrepresentable empty mapping: {value!r}")
+        ldelim, rdelim = MAPPING_DELIMITERS[0]
+        return (
+            ldelim
+            + str.join(
+                MAPPING_SEPARATOR,
+                (
+                    keyencoder(key) + MAPPING_DIVIDER + valueencoder(item)
+                    for key, item in value.items()
+                ),
+            )
+            + rdelim
         )
 
+    @staticmethod
+    def verified(
+        encoder: _Encoder,
+        parser: _Parser,
+        /,
+    ) -> _Encoder:
+        def _verified(value: Any, /) -> str:
+            s = encoder(value)
+            if not _lossless(value, s, parser):
+                raise ValueError(f"unrepresentable value: {value!r}")
+            return s
+
+        return _verified
+
 
 # ################################ HELPERS #####################################
 
 
+def _lossless(value: Any, s: str, parser: _Parser, /) -> bool:
+    try:
+        return repr(parser(s)) == repr(value)
+    except (IndexError, ValueError):
+        return False
+
+
+def _expect(value: Any, type: Any, s: T, /) -> T:
+    if builtins.type(value) is not type:
+        raise TypeError(f"expected {type.__name__}: {value!r}")
+    return s
+
+
+def _expectitem(value: Any, type: Any, s: str, /) -> str:
+    _expect(value, type, s)
+    for sep in {SEQUENCE_SEPARATOR, MAPPING_SEPARATOR}:
+        try:
+            items = list(_split(s, sep, grouping=GROUPINGS, unpack=0))
+        except ValueError:
+            items = None
+        if items != [s]:
+            raise ValueError(f"unrepresentable item: {s!r}")
+    return s
+
+
+def _expectkey(value: Any, type: Any, s: str, /) -> str:
+    if MAPPING_DIVIDER in _expectitem(value, type, s):
+        raise ValueError(f"unrepresentable key: {s!r}")
+    return s
+
+
+def _uncachedresolve(
+    s: str,
+    type: _Ignore,
+    _key: Hashable,
+    /,
+) -> _Ignore:
+    return _resolve.call(s, type, _depth=0)
+
+
+_cachedresolve = functools.lru_cache(maxsize=RESOLVE_CACHE_MAXSIZE)(
+    _uncachedresolve
+)
+
+
+def _typekey(type: _Ignore, /) -> Hashable:
+    # Equal types may still differ in the order of their members (e.g.
+    # `Union[int, str] == Union[str, int]`), so caches are also keyed by
+    # their structure. Unlike their identity, it is shared by equal
+    # instances (e.g. `list[int]`), which are created anew on every use.
+    args = getattr(type, "__args__", None)
+    if not isinstance(args, tuple) or not args:
+        return type
+    return (type, *map(_typekey, args))
+
+
+def _copy(value: T, /) -> T:
+    # Cached results are shared, so their containers are never handed out.
+    _type = builtins.type(value)
+    if _type is list:
+        return [_copy(item) for item in value]  # type: ignore
+    elif _type is dict:
+        return {key: _copy(item) for key, item in value.items()}  # type: ignore
+    elif _type is tuple:
+        return tuple(_copy(item) for item in value)  # type: ignore
+    return value
+
+
+_mappedlength = max(map(len, MAPPED_VALUES))
+
+
+def _mapped(s: str, /) -> _Ignore:
+    # Lowering never shortens a string, so longer strings cannot be a token.
+    if len(s) > _mappedlength:
+        return _UNSET
+    return MAPPED_VALUES.get(s.lower(), _UNSET)
+
+
+def _kind(s: str, /) -> _Kind:
+    sfirst, sdelims = s[0], s[0] + s[-1]
+    return _Kind(
+        builtins.type(_mapped(s)),
+        (
+            sfirst in NUMERIC_LEADING_CHARS
+            or sfirst.isdecimal()
+            or sfirst.isspace()
+        ),
+        sdelims in SEQUENCE_DELIMITERS,
+        sdelims in MAPPING_DELIMITERS,
+    )
+
+
+def _mappedtokens(value: bool | None, /) -> List[str]:
+    return [
+        token
+        for token, _value in MAPPED_VALUES.items()
+        if _value is value  # <format-break>
+    ]
+
+
+@functools.lru_cache(maxsize=None)
+def _environfields(
+    schema: Any,
+    prefix: str,
+    /,
+) -> Tuple[Tuple[str, str, _Parser, bool], ...]:
+    hints = typing.get_type_hints(schema)
+
+    if dataclasses.is_dataclass(schema):
+        _fields = [
+            field
+            for field in dataclasses.fields(schema)
+            if field.init  # <format-break>
+        ]
+        fields = [field.name for field in _fields]
+        required = {
+            field.name
+            for field in _fields
+            if field.default is dataclasses.MISSING
+            and field.default_factory is dataclasses.MISSING
+        }
+    else:
+        required = getattr(schema, "__required_keys__", frozenset(hints))
+        fields = list(hints)
+
+    return tuple(
+        (
+            field,
+            f"{prefix}{field}".upper(),
+            _compile.call(hints[field], 0),
+            field in required,
+        )
+        for field in fields
+    )
+
+
+def _resolvecolumn(
+    strings: Sequence[str],
+    /,
+    type: Type[int] | Type[float] | Type[bool],
+) -> Any:
+    column = numpy.asarray(strings, dtype=numpy.str_)
+
+    if type is bool:
+        column = numpy.char.lower(column)
+        falses = numpy.isin(column, _mappedtokens(False))
+        trues = numpy.isin(column, _mappedtokens(True))
+        if not numpy.all(falses | trues):
+            raise ValueError("invalid bool column")
+        return trues
+
+    # Strings with a base indicator (e.g. "0x10") are rejected here and fall
+    # back to the per-string conversion.
+    return column.astype(numpy.int64 if type is int else numpy.float64)
+
+
 def _split(
     s: str,
     /,
@@ -405,14 +1313,35 @@ def _split(
     grouping: Mapping[str, str],
     unpack: int,
 ) -> Iterable[str]:
-    stack, start = "", (0 if unpack < 0 else unpack)
+    start = 0 if unpack < 0 else unpack
+    if not _openpattern(*grouping).search(s, start):
+        # Without groups every separator splits, so the items are those of a
+        # plain split, except for the delimiters or trailing separator.
+        if unpack >= 0:
+            return s[start : (-unpack or None)].split(sep)
+        items = s.split(sep)
+        if _slast := items.pop()[:unpack]:
+            items.append(_slast)
+        return items
+    return _groupsplit(s, sep, grouping=grouping, unpack=unpack)
+
+
+def _groupsplit(
+    s: str,
+    /,
+    sep: Annotated[str, "char"],
+    *,
+    grouping: Mapping[str, str],
+    unpack: int,
+) -> Iterable[str]:
+    stack, start = list[str](), (0 if unpack < 0 else unpack)
     for index, c in enumerate(s):
         if index < start:
             continue
         elif stack and c == stack[-1]:
-            stack = stack[:-1]
+            stack.pop()
         elif c in grouping:
-            stack += grouping[c]
+            stack.append(grouping[c])
         elif stack:
             pass
         elif c == sep:
@@ -438,6 +1367,136 @@ def _partition(
     raise ValueError(f"invalid partition: {s!r}")
 
 
+# ###################### TOKENS ############################
+
+
+def _tokenize(
+    s: str,
+    /,
+    *,
+    grouping: Mapping[str, str],
+) -> _Tokens:
+    closes, groups = dict[int, int](), {-1: list[int]()}
+    stack = list[Tuple[str, int]]()
+    for match in _tokenpattern(*grouping.items()).finditer(s):
+        index, c = match.start(), match.group()
+        if stack and c == stack[-1][0]:
+            closes[stack.pop()[1]] = index
+        elif c in grouping:
+            groups[stack[-1][1] if stack else -1].append(index)
+            groups[index] = list[int]()
+            stack.append((grouping[c], index))
+    return _Tokens(s, closes, groups, not stack)
+
+
+@functools.lru_cache(maxsize=None)
+def _openpattern(*grouping: str) -> re.Pattern[str]:
+    return re.compile(f"[{re.escape(str.join('', sorted(grouping)))}]")
+
+
+@functools.lru_cache(maxsize=None)
+def _tokenpattern(*grouping: Tuple[str, str]) -> re.Pattern[str]:
+    chars = str.join("", sorted({c for pair in grouping for c in pair}))
+    return re.compile(f"[{re.escape(chars)}]")
+
+
+def _spansplit(
+    s: str,
+    /,
+    sep: Annotated[str, "char"],
+    *,
+    grouping: Mapping[str, str],
+    unpack: int,
+    _at: _Span | None,
+) -> Iterable[_Item]:
+    if _at is None and not _openpattern(*grouping).search(s, max(unpack, 0)):
+        return (
+            (itemstr, None)
+            for itemstr in _split(s, sep, grouping=grouping, unpack=unpack)
+        )
+
+    tokens, start = _at or (_tokenize(s, grouping=grouping), 0)
+    end = start + len(s)
+
+    if unpack > 0 and tokens.closes.get(start, None) == end - 1:
+        # A group enclosing the whole substring splits exactly like the
+        # substring would when scanned on its own, so its structure is reused.
+        children, balanced = tokens.groups[start], True
+    elif unpack <= 0 and start == 0 and end == len(tokens.source):
+        children, balanced = tokens.groups[-1], tokens.balanced
+    else:
+        return (
+            (itemstr, None)
+            for itemstr in _split(s, sep, grouping=grouping, unpack=unpack)
+        )
+
+    return _spanitems(
+        tokens,
+        children,
+        sep,
+        start=(start + 1 if unpack > 0 else start),
+        end=(end - 1 if unpack != 0 else end),
+        balanced=balanced,
+        s=s,
+    )
+
+
+def _spanitems(
+    tokens: _Tokens,
+    children: Iterable[int],
+    sep: Annotated[str, "char"],
+    *,
+    start: int,
+    end: int,
+    balanced: bool,
+    s: str,
+) -> Iterator[_Item]:
+    source, closes = tokens.source, tokens.closes
+
+    # Separators only split outside of enclosed groups, so each region between
+    # them is split at once and items reaching over groups are joined.
+    itemstart = regionstart = start
+    for child in (*children, None):
+        regionend = end if child is None else child
+        offset = regionstart
+        for part in source[regionstart:regionend].split(sep)[:-1]:
+            itemend = offset + len(part)
+            if itemstart != offset:
+                part = source[itemstart:itemend]
+            yield part, (tokens, itemstart)
+            itemstart = offset = itemend + 1
+        if child is None or child not in closes:
+            break
+        regionstart = closes[child] + 1
+
+    if not balanced:
+        raise ValueError(f"invalid split: {s!r}")
+    yield source[itemstart:end], (tokens, itemstart)
+
+
+def _spannested(s: str, _at: _Span, /) -> bool:
+    # Whether the substring is a group enclosing further groups, which cannot
+    # be a number (e.g. "((1,2),3)" but not "(1+2j)").
+    tokens, start = _at
+    return tokens.closes.get(start, None) == start + len(s) - 1 and bool(
+        tokens.groups[start]
+    )
+
+
+def _spanpartition(
+    s: str,
+    /,
+    sep: Annotated[str, "char"],
+    *,
+    _at: _Span | None,
+) -> Tuple[_Item, _Item]:
+    sleft, sright = _partition(s, sep)
+    if _at is None:
+        return (sleft, None), (sright, None)
+    tokens, start = _at
+    return (sleft, _at), (sright, (tokens, start + len(sleft) + 1))
+
+
 # ################################ DEBUG #######################################
 
 
@@ -0,0 +1,158 @@
+import importlib
+import os.path
+from concurrent.futures import ThreadPoolExecutor
+from types import ModuleType
+from typing import (
+    Any,
+    Dict,
+    Final,
+    Iterable,
+    List,
+    Mapping,
+    Type,
+    TypedDict,
+    TypeVar,
+)
+
+
+# ################################ PACKAGE #####################################
+
+
+__sname__ = "fconfig"
+__version__ = "1.0"
+__description__ = ...
+
+__requires__ = ("jsonschema",)
+
+
+__all__ = (
+    # fmt: off
+    "load_many",
+    "LoadError",
+    # fmt: on
+)
+
+
+# ################################ TYPING ######################################
+
+
+TSCHEMA = TypeVar(
+    "TSCHEMA",
+    bound=TypedDict,  # pyright: ignore[reportInvalidTypeForm]
+)
+
+
+# ################################ EXCEPTIONS ##################################
+
+
+class LoadError(Exception):
+    def __init__(
+        self,
+        errors: Mapping[str, Exception],
+        results: List[Any],
+    ) -> None:
+        super().__init__(errors, results)
+        self.errors = errors
+        self.results = results
+
+    def __str__(self) -> str:
+        return "invalid files: " + str.join(", ", self.errors)
+
+
+# ################################ CONSTANTS ###################################
+
+
+LOADERS: Final = {
+    ".json": ("fjson", "JsonSchema"),
+    ".toml": ("ftoml", "TomlSchema"),
+    ".yaml": ("fyaml", "YamlSchema"),
+    ".yml": ("fyaml", "YamlSchema"),
+    ".ini": ("fini", "IniSchema"),
+    ".cfg": ("fini", "IniSchema"),
+}
+
+
+# ################################ FUNCTIONS ###################################
+
+
+def load_many(
+    paths: Iterable[str],
+    /,
+    schema: Any | Type[TSCHEMA],
+    *,
+    validate: bool = True,
+    workers: int | None = None,
+) -> List[TSCHEMA]:
+    paths = list(paths)
+    schemas = dict[str, Any]()
+
+    # Results are collected before the first error is reported, so that a
+    # single broken file does not hide the state of all the others.
+    def _result(path: str) -> Any:
+        try:
+            return _load(path, schema, schemas, validate)
+        except Exception as exc:
+            return _Failure(exc)
+
+    if workers:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_result, paths))
+    else:
+        results = list(map(_result, paths))
+
+    errors = dict[str, Exception]()
+    for index, (path, result) in enumerate(zip(paths, results, strict=True)):
+        if isinstance(result, _Failure):
+            errors[path] = result.exc
+            results[index] = None
+
+    if errors:
+        raise LoadError(errors, results)
+    return results
+
+
+# ################################ HELPERS #####################################
+
+
+class _Failure:
+    __slots__ = ("exc",)
+
+    def __init__(self, exc: Exception) -> None:
+        self.exc = exc
+
+
+def _load(
+    path: str,
+    schema: Any,
+    schemas: Dict[str, Any],
+    validate: bool,
+    /,
+) -> Any:
+    extension = os.path.splitext(path)[1].lower()
+    if extension not in LOADERS:
+        raise ValueError(f"unsupported file extension: {path!r}")
+
+    # Loader modules are imported on first use, so that only the parsers of
+    # the loaded formats need to be installed.
+    modulename, schemaname = LOADERS[extension]
+    module = importlib.import_module(modulename)
+    if modulename not in schemas:
+        schemas[modulename] = _schema(module, schemaname, schema)
+
+    return module.load(path, schemas[modulename], validate=validate)
+
+
+def _schema(module: ModuleType, schemaname: str, schema: Any, /) -> Any:
+    # Types are not validated against, and are valid for every loader.
+    if isinstance(schema, type):
+        return schema
+
+    schematype = getattr(module, schemaname)
+    if isinstance(schema, schematype):
+        return schema
+
+    # Schemas of other formats share the declaration, but every loader only
+    # validates against its own schema type.
+    if schemaname == "IniSchema":
+        return schematype(schema.decl, None, None)
+    return schematype(schema.decl)
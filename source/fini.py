@@ -1,11 +1,21 @@
+import copy
+import dataclasses
+import functools
 import json
+import os
+import re
 from configparser import BasicInterpolation, ConfigParser
 from dataclasses import dataclass
 from typing import (
     Any,
+    Callable,
+    Dict,
     Final,
     Generic,
+    Iterator,
+    List,
     Mapping,
+    Tuple,
     Type,
     TypedDict,
     TypeVar,
@@ -13,6 +23,7 @@ from typing import (
 )
 
 import jsonschema
+from jsonschema.protocols import Validator
 
 
 # ################################ PACKAGE #####################################
@@ -28,6 +39,8 @@ __requires__ = ("jsonschema",)
 __all__ = (
     # fmt: off
     "IniSchema",
+    "IniView", "IniSectionView",
+    "clear_caches",
     # fmt: on
 )
 
@@ -35,6 +48,8 @@ __all__ = (
 # ################################ TYPING ######################################
 
 
+T = TypeVar("T")
+
 TSCHEMA = TypeVar(
     "TSCHEMA",
     bound=TypedDict,  # pyright: ignore[reportInvalidTypeForm]
@@ -45,6 +60,10 @@ TPARSER = TypeVar(
     bound=ConfigParser,
 )
 
+_Converter = Callable[[str], Any]
+
+_Converters = Mapping[str, Mapping[str, _Converter]]
+
 
 # ################################ TYPES #######################################
 
@@ -56,10 +75,131 @@ class IniSchema(Generic[TSCHEMA, TPARSER]):
     parser: Type[TPARSER] | None
     args: Mapping[str, Any] | None
 
+    validator: Validator = dataclasses.field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "validator", _validator(self.decl))
+
+
+class IniView(Mapping[str, "IniSectionView"]):
+    __slots__ = ("parser", "validator", "converters", "_sections")
+
+    def __init__(
+        self,
+        parser: ConfigParser,
+        validator: Validator | None = None,
+        converters: _Converters | None = None,
+    ) -> None:
+        self.parser = parser
+        self.validator = validator
+        self.converters = converters
+        self._sections = dict[str, IniSectionView]()
+
+        if validator is None:
+            return
+
+        # Sections are validated on first access, so only the constraints on
+        # the set of sections are checked up front. Other schemas cannot be
+        # split by section, and are validated at once.
+        shallow = _shallowschema(validator.schema)
+        if shallow is None:
+            _validate(_parserdict(parser, converters), validator)
+            self.validator = None
+        else:
+            _validate(
+                {section: {} for section in parser.sections()},
+                validator.evolve(schema=shallow),
+            )
+
+    def __getitem__(self, section: str, /) -> "IniSectionView":
+        view = self._sections.get(section)
+        if view is not None:
+            return view
+
+        if not self.parser.has_section(section):
+            raise KeyError(section)
+        view = IniSectionView(
+            self.parser,
+            section,
+            (self.converters or {}).get(section),
+        )
+
+        if self.validator is not None:
+            _validatesection(dict(view), section, self.validator)
+
+        self._sections[section] = view
+        return view
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.parser.sections())
+
+    def __len__(self) -> int:
+        return len(self.parser.sections())
+
+    def __contains__(self, section: object, /) -> bool:
+        # Membership does not access the section, so it is not validated.
+        return isinstance(section, str) and self.parser.has_section(section)
+
+
+class IniSectionView(Mapping[str, Any]):
+    __slots__ = ("parser", "section", "converters", "_values")
+
+    def __init__(
+        self,
+        parser: ConfigParser,
+        section: str,
+        converters: Mapping[str, _Converter] | None = None,
+    ) -> None:
+        self.parser = parser
+        self.section = section
+        self.converters = converters
+        self._values = dict[str, Any]()
+
+    def __getitem__(self, option: str, /) -> Any:
+        # Values are only interpolated once, when they are first accessed.
+        try:
+            return self._values[option]
+        except KeyError:
+            pass
+
+        if not self.parser.has_option(self.section, option):
+            raise KeyError(option)
+        value = _convert(
+            option,
+            self.parser.get(self.section, option),
+            self.converters,
+        )
+        self._values[option] = value
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.parser.options(self.section))
+
+    def __len__(self) -> int:
+        return len(self.parser.options(self.section))
+
+    def __contains__(self, option: object, /) -> bool:
+        return isinstance(option, str) and self.parser.has_option(
+            self.section, option
+        )
+
 
 # ################################ CONSTANTS ###################################
 
 
+CACHE_MAXSIZE: Final = 128
+
+# Keywords whose constraints on section contents are confined to the
+# subschemas of single sections.
+# fmt:off
+SHALLOW_KEYWORDS: Final = frozenset((
+    "$schema", "$id", "$comment", "$defs", "definitions",
+    "title", "description", "default", "examples",
+    "type", "required", "minProperties", "maxProperties",
+    "properties", "patternProperties", "additionalProperties",
+))
+# fmt:on
+
 DEFAULT_PARSER_TYPE: Final = ConfigParser
 
 # fmt:off
@@ -79,6 +219,14 @@ DEFAULT_PARSER_ARGS: Final = dict[str, Any](
 # fmt:on
 
 
+# Tried in order, where a failing conversion raises ValueError or KeyError.
+TYPE_CONVERTERS: Final = dict[str, Tuple[Callable[[str], Any], ...]](
+    integer=(int,),
+    number=(int, float),
+    boolean=(lambda value: ConfigParser.BOOLEAN_STATES[value.lower()],),
+)
+
+
 # ################################ FUNCTIONS ###################################
 
 
@@ -107,6 +255,8 @@ def load(
     path: str,
     /,
     schema: Type[TSCHEMA],
+    *,
+    cache: bool = ...,
 ) -> TSCHEMA: ...
 
 
@@ -117,6 +267,8 @@ def load(
     schema: IniSchema[TSCHEMA, TPARSER],
     *,
     validate: bool = ...,
+    cache: bool = ...,
+    convert: bool = ...,
 ) -> TSCHEMA: ...
 
 
@@ -126,25 +278,33 @@ def load(
     schema: IniSchema[TSCHEMA, TPARSER] | Type[TSCHEMA],
     *,
     validate: bool = True,
+    cache: bool = False,
+    convert: bool = False,
 ) -> TSCHEMA:
     data: TSCHEMA
 
-    if isinstance(schema, IniSchema):
-        parser_type = schema.parser or DEFAULT_PARSER_TYPE
-        parser_args = schema.args or DEFAULT_PARSER_ARGS
-    else:
-        parser_type = DEFAULT_PARSER_TYPE
-        parser_args = DEFAULT_PARSER_ARGS
-
-    parser = parser_type(**parser_args)
-
-    with open(path, "r", encoding="utf-8") as file:
-        parser.read_file(file)
-
-    data = _parserdict(parser)  # type: ignore
+    if cache:
+        # Keyed by file identity, so that a modified file is loaded again.
+        stat = os.stat(path)
+        data = _cachedload(
+            os.path.abspath(path),
+            schema,
+            validate,
+            convert,
+            stat.st_mtime_ns,
+            stat.st_size,
+        )
+        return _copy(data)
+
+    parser = _parser(path, schema)
+
+    data = _parserdict(
+        parser,
+        (_converters(schema) if convert else None),
+    )  # type: ignore
 
     if validate and isinstance(schema, IniSchema):
-        jsonschema.validate(data, schema.decl)
+        _validate(data, schema.validator)
 
     return data
 
@@ -164,6 +324,7 @@ def loadp(
     schema: IniSchema[TSCHEMA, TPARSER],
     *,
     validate: bool = ...,
+    convert: bool = ...,
 ) -> TPARSER: ...
 
 
@@ -173,9 +334,75 @@ def loadp(
     schema: IniSchema[TSCHEMA, TPARSER] | Type[TSCHEMA],
     *,
     validate: bool = True,
+    convert: bool = False,
 ) -> TPARSER:
-    data: TSCHEMA
+    parser = _parser(path, schema)
+
+    # Validated one section at a time, so that no full copy of the parser
+    # contents is kept alongside it.
+    if validate and isinstance(schema, IniSchema):
+        converters = _converters(schema) if convert else {}
+        view = IniView(parser, schema.validator, converters)
+        if view.validator is not None:
+            for section in parser.sections():
+                _validatesection(
+                    _sectiondict(parser, section, converters.get(section)),
+                    section,
+                    view.validator,
+                )
+
+    return parser  # type: ignore
+
+
+@overload
+def loadv(
+    path: str,
+    /,
+    schema: Type[TSCHEMA],
+) -> IniView: ...
+
+
+@overload
+def loadv(
+    path: str,
+    /,
+    schema: IniSchema[TSCHEMA, TPARSER],
+    *,
+    validate: bool = ...,
+    convert: bool = ...,
+) -> IniView: ...
+
 
+def loadv(
+    path: str,
+    /,
+    schema: IniSchema[TSCHEMA, TPARSER] | Type[TSCHEMA],
+    *,
+    validate: bool = True,
+    convert: bool = False,
+) -> IniView:
+    parser = _parser(path, schema)
+
+    return IniView(
+        parser,
+        (
+            schema.validator
+            if validate and isinstance(schema, IniSchema)
+            else None
+            # <format-break>
+        ),
+        (_converters(schema) if convert else None),
+    )
+
+
+def clear_caches() -> None:
+    _cachedload.cache_clear()
+
+
+# ################################ HELPERS #####################################
+
+
+def _parser(path: str, schema: Any, /) -> ConfigParser:
     if isinstance(schema, IniSchema):
         parser_type = schema.parser or DEFAULT_PARSER_TYPE
         parser_args = schema.args or DEFAULT_PARSER_ARGS
@@ -183,25 +410,185 @@ def loadp(
         parser_type = DEFAULT_PARSER_TYPE
         parser_args = DEFAULT_PARSER_ARGS
 
+    # Interpolation instances are not shared between parsers.
+    if parser_args.get("interpolation") is not None:
+        parser_args = dict(parser_args)
+        parser_args["interpolation"] = copy.copy(parser_args["interpolation"])
+
     parser = parser_type(**parser_args)
 
     with open(path, "r", encoding="utf-8") as file:
         parser.read_file(file)
 
-    if validate and isinstance(schema, IniSchema):
-        data = _parserdict(parser)  # type: ignore
+    return parser
 
-        jsonschema.validate(data, schema.decl)
 
-    return parser  # type: ignore
+def _validator(decl: Any, /) -> Validator:
+    # Same checks as `jsonschema.validate`, but the schema is only checked
+    # and the validator only built once per schema object.
+    cls = jsonschema.validators.validator_for(decl)
+    cls.check_schema(decl)
+    return cls(decl)
 
 
-# ################################ HELPERS #####################################
+def _validate(data: Any, validator: Validator, /) -> None:
+    error = jsonschema.exceptions.best_match(validator.iter_errors(data))
+    if error is not None:
+        raise error
+
+
+def _shallowschema(decl: Any, /) -> Any | None:
+    if not isinstance(decl, dict) or not SHALLOW_KEYWORDS.issuperset(decl):
+        return None
+
+    # Section schemas are replaced by `true`, which keeps them as known
+    # properties (e.g. for "additionalProperties": false).
+    shallow = dict(decl)
+    for keyword in ("properties", "patternProperties"):
+        if keyword in shallow:
+            shallow[keyword] = dict.fromkeys(shallow[keyword], True)
+    if isinstance(shallow.get("additionalProperties"), dict):
+        shallow["additionalProperties"] = True
+    return shallow
+
+
+def _validatesection(
+    data: Any,
+    section: str,
+    validator: Validator,
+    /,
+) -> None:
+    for subschema in _sectionschemas(validator.schema, section):
+        _validate(data, validator.evolve(schema=subschema))
+
+
+def _sectionschemas(decl: Any, section: str, /) -> List[Any]:
+    # Same applicability rules as for object properties in JSON Schema.
+    if not isinstance(decl, dict):
+        return []
 
+    subschemas = list[Any]()
+    if section in decl.get("properties", {}):
+        subschemas.append(decl["properties"][section])
+    for pattern, subschema in decl.get("patternProperties", {}).items():
+        if re.search(pattern, section):
+            subschemas.append(subschema)
+    if not subschemas and "additionalProperties" in decl:
+        subschemas.append(decl["additionalProperties"])
+    return subschemas
 
-def _parserdict(source: ConfigParser, /) -> dict[str, Any]:
+
+@functools.lru_cache(maxsize=CACHE_MAXSIZE)
+def _cachedload(
+    path: str,
+    schema: Any,
+    validate: bool,
+    convert: bool,
+    _mtime_ns: int,
+    _size: int,
+    /,
+) -> Any:
+    return load(path, schema, validate=validate, convert=convert)
+
+
+def _copy(value: T, /) -> T:
+    # Cached results are shared, so their containers are never handed out.
+    _type = type(value)
+    if _type is list:
+        return [_copy(item) for item in value]  # type: ignore
+    elif _type is dict:
+        return {key: _copy(item) for key, item in value.items()}  # type: ignore
+    return value
+
+
+def _parserdict(
+    source: ConfigParser,
+    converters: _Converters | None = None,
+    /,
+) -> dict[str, Any]:
     return {
-        section: dict(source.items(section))
+        section: _sectiondict(
+            source,
+            section,
+            (converters or {}).get(section),
+        )
         for section in source.sections()
         # <format-newline>
     }
+
+
+def _sectiondict(
+    source: ConfigParser,
+    section: str,
+    converters: Mapping[str, _Converter] | None = None,
+    /,
+) -> dict[str, Any]:
+    if not converters:
+        return dict(source.items(section))
+    return {
+        option: _convert(option, value, converters)
+        for option, value in source.items(section)
+        # <format-newline>
+    }
+
+
+# ###################### CONVERTERS ########################
+
+
+def _convert(
+    option: str,
+    value: str | None,
+    converters: Mapping[str, _Converter] | None,
+    /,
+) -> Any:
+    if value is None or not converters or option not in converters:
+        return value
+    return converters[option](value)
+
+
+@functools.lru_cache(maxsize=CACHE_MAXSIZE)
+def _converters(schema: Any, /) -> _Converters:
+    # Compiled once per schema from the types declared for each option.
+    converters = dict[str, Dict[str, _Converter]]()
+    if not isinstance(schema, IniSchema) or not isinstance(schema.decl, dict):
+        return converters
+
+    sections = schema.decl.get("properties", {})
+    for section, sectiondecl in sections.items():
+        if not isinstance(sectiondecl, dict):
+            continue
+        for option, optiondecl in sectiondecl.get("properties", {}).items():
+            if not isinstance(optiondecl, dict):
+                continue
+            converter = _converter(optiondecl.get("type"))
+            if converter is not None:
+                converters.setdefault(section, {})[option] = converter
+
+    return converters
+
+
+def _converter(types: Any, /) -> _Converter | None:
+    if isinstance(types, str):
+        types = [types]
+    elif not isinstance(types, list):
+        return None
+
+    # Strings need no conversion, so later types are never tried.
+    functions = list[Callable[[str], Any]]()
+    for type in types:
+        if type == "string":
+            break
+        functions.extend(TYPE_CONVERTERS.get(type, ()))
+    if not functions:
+        return None
+
+    def _converter(value: str, /) -> Any:
+        for function in functions:
+            try:
+                return function(value)
+            except (ValueError, KeyError):
+                continue
+        # Unconvertible values are kept, and reported by the validation.
+        return value
+
+    return _converter
@@ -1,8 +1,35 @@
+import dataclasses
+import functools
+import itertools
 import json
+import mmap as _internalmmap
+import os
+import re
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
 from dataclasses import dataclass
-from typing import Generic, Type, TypedDict, TypeVar, overload
+from typing import (
+    Any,
+    Final,
+    Generic,
+    Iterator,
+    List,
+    TextIO,
+    Tuple,
+    Type,
+    TypedDict,
+    TypeVar,
+    overload,
+)
 
 import jsonschema
+from jsonschema.protocols import Validator
+
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
 
 
 # ################################ PACKAGE #####################################
@@ -18,6 +45,7 @@ __requires__ = ("jsonschema",)
 __all__ = (
     # fmt: off
     "JsonSchema",
+    "clear_caches",
     # fmt: on
 )
 
@@ -25,6 +53,8 @@ __all__ = (
 # ################################ TYPING ######################################
 
 
+T = TypeVar("T")
+
 TSCHEMA = TypeVar(
     "TSCHEMA",
     bound=TypedDict,  # pyright: ignore[reportInvalidTypeForm]
@@ -38,6 +68,20 @@ TSCHEMA = TypeVar(
 class JsonSchema(Generic[TSCHEMA]):
     decl: TSCHEMA
 
+    validator: Validator = dataclasses.field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "validator", _validator(self.decl))
+
+
+# ################################ CONSTANTS ###################################
+
+
+CACHE_MAXSIZE: Final = 128
+
+ILOAD_CHUNK_SIZE: Final = 1 << 16
+ILOAD_CHUNK_LINES: Final = 1024
+
 
 # ################################ FUNCTIONS ###################################
 
@@ -49,10 +93,10 @@ def schema(
 ) -> JsonSchema[TSCHEMA]:
     schema: JsonSchema[TSCHEMA]
 
-    with open(path, "r", encoding="utf-8") as file:
-        s = file.read()
+    with open(path, "rb") as file:
+        b = file.read()
 
-    decl = json.loads(s)  # type: ignore
+    decl = _loads(b)  # type: ignore
 
     schema = JsonSchema(decl)
 
@@ -64,6 +108,9 @@ def load(
     path: str,
     /,
     schema: Type[TSCHEMA],
+    *,
+    cache: bool = ...,
+    mmap: bool = ...,
 ) -> TSCHEMA: ...
 
 
@@ -74,6 +121,8 @@ def load(
     schema: JsonSchema[TSCHEMA],
     *,
     validate: bool = ...,
+    cache: bool = ...,
+    mmap: bool = ...,
 ) -> TSCHEMA: ...
 
 
@@ -83,15 +132,324 @@ def load(
     schema: JsonSchema[TSCHEMA] | Type[TSCHEMA],
     *,
     validate: bool = True,
+    cache: bool = False,
+    mmap: bool = False,
 ) -> TSCHEMA:
     data: TSCHEMA
 
-    with open(path, "r", encoding="utf-8") as file:
-        s = file.read()
-
-    data = json.loads(s)  # type: ignore
+    if cache:
+        # Keyed by file identity, so that a modified file is loaded again.
+        stat = os.stat(path)
+        data = _cachedload(
+            os.path.abspath(path),
+            schema,
+            validate,
+            stat.st_mtime_ns,
+            stat.st_size,
+        )
+        return _copy(data)
+
+    with open(path, "rb") as file:
+        # Mapping the file hands its pages to the parser without copying
+        # them into a bytes object first (empty files cannot be mapped).
+        if mmap and os.fstat(file.fileno()).st_size:
+            with (
+                _internalmmap.mmap(
+                    file.fileno(),
+                    0,
+                    access=_internalmmap.ACCESS_READ,
+                ) as buffer,
+                memoryview(buffer) as view,
+            ):
+                data = _loads(view)  # type: ignore
+        else:
+            data = _loads(file.read())  # type: ignore
 
     if validate and isinstance(schema, JsonSchema):
-        jsonschema.validate(data, schema.decl)
+        _validate(data, schema.validator)
 
     return data
+
+
+@overload
+def iload(
+    path: str,
+    /,
+    schema: Type[TSCHEMA],
+    *,
+    concatenated: bool = ...,
+    workers: int | None = ...,
+) -> Iterator[TSCHEMA]: ...
+
+
+@overload
+def iload(
+    path: str,
+    /,
+    schema: JsonSchema[TSCHEMA],
+    *,
+    validate: bool = ...,
+    concatenated: bool = ...,
+    workers: int | None = ...,
+) -> Iterator[TSCHEMA]: ...
+
+
+def iload(
+    path: str,
+    /,
+    schema: JsonSchema[TSCHEMA] | Type[TSCHEMA],
+    *,
+    validate: bool = True,
+    concatenated: bool = False,
+    workers: int | None = None,
+) -> Iterator[TSCHEMA]:
+    data: TSCHEMA
+
+    validator = (
+        schema.validator
+        if validate and isinstance(schema, JsonSchema)
+        else None
+        # <format-break>
+    )
+
+    with open(path, "r", encoding="utf-8") as file:
+        if workers:
+            if concatenated:
+                raise ValueError("workers require JSON Lines input")
+
+            yield from _ilines(file, validator, workers)
+            return
+
+        if concatenated:
+            values = _iconcatenated(file)
+        else:
+            values = (_loads(line) for line in file if line.strip())
+
+        for data in values:
+            if validator is not None:
+                _validate(data, validator)
+
+            yield data
+
+
+def clear_caches() -> None:
+    _cachedload.cache_clear()
+
+
+# ################################ HELPERS #####################################
+
+
+def _validator(decl: Any, /) -> Validator:
+    # Same checks as `jsonschema.validate`, but the schema is only checked
+    # and the validator only built once per schema object.
+    cls = jsonschema.validators.validator_for(decl)
+    cls.check_schema(decl)
+    return cls(decl)
+
+
+def _validate(data: Any, validator: Validator, /) -> None:
+    error = jsonschema.exceptions.best_match(validator.iter_errors(data))
+    if error is not None:
+        raise error
+
+
+def _loads(s: str | bytes | memoryview, /) -> Any:
+    if orjson is not None and not _longdigits(s):
+        try:
+            return orjson.loads(s)
+        except orjson.JSONDecodeError:
+            # Documents orjson rejects but json accepts (e.g. NaN or lone
+            # surrogates) still load the same.
+            pass
+    if not isinstance(s, str):
+        s = str(s, "utf-8")
+    return json.loads(s)
+
+
+_DIGITS_TABLE: Final = bytes.maketrans(b"123456789", b"000000000")
+_LONG_DIGITS: Final = b"0" * 19
+
+
+def _longdigits(s: str | bytes | memoryview, /) -> bool:
+    # orjson loads integers beyond 64 bits as floats instead of failing, and
+    # these take at least 19 digits.
+    if len(s) < len(_LONG_DIGITS):
+        return False
+    if isinstance(s, str):
+        s = s.encode("utf-8")
+    if isinstance(s, bytes):
+        return s.translate(_DIGITS_TABLE).find(_LONG_DIGITS) >= 0
+
+    # Mapped files are scanned in chunks, so that they are not copied at once.
+    overlap = len(_LONG_DIGITS) - 1
+    for start in range(0, len(s) - overlap, ILOAD_CHUNK_SIZE):
+        chunk = bytes(s[start : (start + ILOAD_CHUNK_SIZE + overlap)])
+        if chunk.translate(_DIGITS_TABLE).find(_LONG_DIGITS) >= 0:
+            return True
+    return False
+
+
+def _iconcatenated(file: TextIO, /) -> Iterator[Any]:
+    decoder = json.JSONDecoder()
+    buffer = ""
+    pos = 0
+    chunksize = ILOAD_CHUNK_SIZE
+    eof = False
+
+    # Start of the buffer within the file, so that errors report positions
+    # within the file.
+    offset, lineno, linestart = 0, 1, 0
+
+    while True:
+        pos = _WHITESPACE.match(buffer, pos).end()  # type: ignore
+        if pos == len(buffer) and eof:
+            return
+
+        if pos < len(buffer):
+            try:
+                data, end = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError as exc:
+                # Only values cut off by the end of the buffer are read
+                # further, while syntax errors are followed by more text.
+                if eof or not _truncated(exc):
+                    raise _decodeerror(exc, offset, lineno, linestart) from None
+                end = None
+
+            # A value ending with the buffer may continue in the next chunk
+            # (e.g. numbers), and is only complete once followed by more text.
+            if end is not None and (
+                eof or not _PARTIAL_TOKEN.fullmatch(buffer, end)
+            ):
+                yield data
+                pos = end
+                chunksize = ILOAD_CHUNK_SIZE
+                continue
+
+            # Grown geometrically, so that large values are not decoded
+            # again for every chunk.
+            chunksize *= 2
+
+        # Decoded values are only dropped from the buffer when reading, so
+        # that the rest is not copied for every value.
+        newlines = buffer.count("\n", 0, pos)
+        if newlines:
+            lineno += newlines
+            linestart = offset + buffer.rfind("\n", 0, pos) + 1
+        offset += pos
+
+        chunk = file.read(chunksize)
+        eof = not chunk
+        buffer = buffer[pos:] + chunk
+        pos = 0
+
+
+_WHITESPACE: Final = re.compile(r"[ \t\n\r]*")
+
+_PARTIAL_TOKEN: Final = re.compile(r"[\w.+-]*")
+
+
+def _truncated(exc: json.JSONDecodeError, /) -> bool:
+    # Strings run up to the end of the buffer, while other tokens are cut off
+    # within literals, numbers or escapes (e.g. "tru", "1e" or "\u00").
+    return exc.msg.startswith("Unterminated string") or bool(
+        _PARTIAL_TOKEN.fullmatch(exc.doc, exc.pos)
+    )
+
+
+def _decodeerror(
+    exc: json.JSONDecodeError,
+    offset: int,
+    lineno: int,
+    linestart: int,
+    /,
+) -> json.JSONDecodeError:
+    error = json.JSONDecodeError(exc.msg, exc.doc, exc.pos)
+    error.pos = offset + exc.pos
+    error.lineno = lineno + exc.lineno - 1
+    if exc.lineno == 1:
+        error.colno = error.pos - linestart + 1
+    error.args = (
+        f"{exc.msg}: line {error.lineno} column {error.colno}"
+        f" (char {error.pos})",
+    )
+    return error
+
+
+def _ilines(
+    file: TextIO,
+    validator: Validator | None,
+    workers: int,
+    /,
+) -> Iterator[Any]:
+    decl = None if validator is None else json.dumps(validator.schema)
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # Only a bounded number of chunks is read ahead of the consumer.
+        pending = deque[Tuple[List[str], Future[Tuple[List[Any], int]]]]()
+        while True:
+            lines = list(itertools.islice(file, ILOAD_CHUNK_LINES))
+            if lines:
+                future = executor.submit(_loadlines, lines, decl)
+                pending.append((lines, future))
+            if not pending:
+                return
+            if lines and len(pending) < 2 * workers:
+                continue
+
+            lines, future = pending.popleft()
+            values, end = future.result()
+            yield from values
+
+            # Errors are not sent back from the workers (validation errors
+            # cannot be pickled), so the failing line is loaded again here.
+            if end < len(lines):
+                data = _loads(lines[end])
+                if validator is not None:
+                    _validate(data, validator)
+
+
+def _loadlines(
+    lines: List[str],
+    decl: str | None,
+    /,
+) -> Tuple[List[Any], int]:
+    values = list[Any]()
+    validator = None if decl is None else _declvalidator(decl)
+    for index, line in enumerate(lines):
+        if not line.strip():
+            continue
+        try:
+            data = _loads(line)
+            if validator is not None:
+                _validate(data, validator)
+        except (ValueError, jsonschema.ValidationError):
+            return values, index
+        values.append(data)
+    return values, len(lines)
+
+
+@functools.lru_cache(maxsize=None)
+def _declvalidator(decl: str, /) -> Validator:
+    return _validator(json.loads(decl))
+
+
+@functools.lru_cache(maxsize=CACHE_MAXSIZE)
+def _cachedload(
+    path: str,
+    schema: Any,
+    validate: bool,
+    _mtime_ns: int,
+    _size: int,
+    /,
+) -> Any:
+    return load(path, schema, validate=validate)
+
+
+def _copy(value: T, /) -> T:
+    # Cached results are shared, so their containers are never handed out.
+    _type = type(value)
+    if _type is list:
+        return [_copy(item) for item in value]  # type: ignore
+    elif _type is dict:
+        return {key: _copy(item) for key, item in value.items()}  # type: ignore
+    return value
@@ -1,9 +1,13 @@
+import dataclasses
+import functools
 import json
+import os
 import tomllib
 from dataclasses import dataclass
-from typing import Generic, Type, TypedDict, TypeVar, overload
+from typing import Any, Final, Generic, Type, TypedDict, TypeVar, overload
 
 import jsonschema
+from jsonschema.protocols import Validator
 
 
 # ################################ PACKAGE #####################################
@@ -19,6 +23,7 @@ __requires__ = ("jsonschema",)
 __all__ = (
     # fmt: off
     "TomlSchema",
+    "clear_caches",
     # fmt: on
 )
 
@@ -26,6 +31,8 @@ __all__ = (
 # ################################ TYPING ######################################
 
 
+T = TypeVar("T")
+
 TSCHEMA = TypeVar(
     "TSCHEMA",
     bound=TypedDict,  # pyright: ignore[reportInvalidTypeForm]
@@ -39,6 +46,17 @@ TSCHEMA = TypeVar(
 class TomlSchema(Generic[TSCHEMA]):
     decl: TSCHEMA
 
+    validator: Validator = dataclasses.field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "validator", _validator(self.decl))
+
+
+# ################################ CONSTANTS ###################################
+
+
+CACHE_MAXSIZE: Final = 128
+
 
 # ################################ FUNCTIONS ###################################
 
@@ -65,6 +83,8 @@ def load(
     path: str,
     /,
     schema: Type[TSCHEMA],
+    *,
+    cache: bool = ...,
 ) -> TSCHEMA: ...
 
 
@@ -75,6 +95,7 @@ def load(
     schema: TomlSchema[TSCHEMA],
     *,
     validate: bool = ...,
+    cache: bool = ...,
 ) -> TSCHEMA: ...
 
 
@@ -84,15 +105,69 @@ def load(
     schema: TomlSchema[TSCHEMA] | Type[TSCHEMA],
     *,
     validate: bool = True,
+    cache: bool = False,
 ) -> TSCHEMA:
     data: TSCHEMA
 
-    with open(path, "r", encoding="utf-8") as file:
-        s = file.read()
-
-    data = tomllib.loads(s)  # type: ignore
+    if cache:
+        # Keyed by file identity, so that a modified file is loaded again.
+        stat = os.stat(path)
+        data = _cachedload(
+            os.path.abspath(path),
+            schema,
+            validate,
+            stat.st_mtime_ns,
+            stat.st_size,
+        )
+        return _copy(data)
+
+    with open(path, "rb") as file:
+        data = tomllib.load(file)  # type: ignore
 
     if validate and isinstance(schema, TomlSchema):
-        jsonschema.validate(data, schema.decl)
+        _validate(data, schema.validator)
 
     return data
+
+
+def clear_caches() -> None:
+    _cachedload.cache_clear()
+
+
+# ################################ HELPERS #####################################
+
+
+def _validator(decl: Any, /) -> Validator:
+    # Same checks as `jsonschema.validate`, but the schema is only checked
+    # and the validator only built once per schema object.
+    cls = jsonschema.validators.validator_for(decl)
+    cls.check_schema(decl)
+    return cls(decl)
+
+
+def _validate(data: Any, validator: Validator, /) -> None:
+    error = jsonschema.exceptions.best_match(validator.iter_errors(data))
+    if error is not None:
+        raise error
+
+
+@functools.lru_cache(maxsize=CACHE_MAXSIZE)
+def _cachedload(
+    path: str,
+    schema: Any,
+    validate: bool,
+    _mtime_ns: int,
+    _size: int,
+    /,
+) -> Any:
+    return load(path, schema, validate=validate)
+
+
+def _copy(value: T, /) -> T:
+    # Cached results are shared, so their containers are never handed out.
+    _type = type(value)
+    if _type is list:
+        return [_copy(item) for item in value]  # type: ignore
+    elif _type is dict:
+        return {key: _copy(item) for key, item in value.items()}  # type: ignore
+    return value
@@ -1,9 +1,22 @@
+import dataclasses
+import functools
 import json
+import os
 from dataclasses import dataclass
-from typing import Generic, Type, TypedDict, TypeVar, overload
+from typing import (
+    Any,
+    Final,
+    Generic,
+    Iterator,
+    Type,
+    TypedDict,
+    TypeVar,
+    overload,
+)
 
 import jsonschema
 import yaml
+from jsonschema.protocols import Validator
 
 
 # ################################ PACKAGE #####################################
@@ -19,6 +32,7 @@ __requires__ = ("jsonschema", "yaml")
 __all__ = (
     # fmt: off
     "YamlSchema",
+    "clear_caches",
     # fmt: on
 )
 
@@ -26,6 +40,8 @@ __all__ = (
 # ################################ TYPING ######################################
 
 
+T = TypeVar("T")
+
 TSCHEMA = TypeVar(
     "TSCHEMA",
     bound=TypedDict,  # pyright: ignore[reportInvalidTypeForm]
@@ -39,6 +55,20 @@ TSCHEMA = TypeVar(
 class YamlSchema(Generic[TSCHEMA]):
     decl: TSCHEMA
 
+    validator: Validator = dataclasses.field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "validator", _validator(self.decl))
+
+
+# ################################ CONSTANTS ###################################
+
+
+CACHE_MAXSIZE: Final = 128
+
+# The libyaml based loader is only available if PyYAML was built with it.
+YAML_LOADER: Final = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 # ################################ FUNCTIONS ###################################
 
@@ -65,6 +95,8 @@ def load(
     path: str,
     /,
     schema: Type[TSCHEMA],
+    *,
+    cache: bool = ...,
 ) -> TSCHEMA: ...
 
 
@@ -75,6 +107,7 @@ def load(
     schema: YamlSchema[TSCHEMA],
     *,
     validate: bool = ...,
+    cache: bool = ...,
 ) -> TSCHEMA: ...
 
 
@@ -84,15 +117,106 @@ def load(
     schema: YamlSchema[TSCHEMA] | Type[TSCHEMA],
     *,
     validate: bool = True,
+    cache: bool = False,
 ) -> TSCHEMA:
     data: TSCHEMA
 
-    with open(path, "r", encoding="utf-8") as file:
-        s = file.read()
-
-    data = yaml.load(s)  # type: ignore
+    if cache:
+        # Keyed by file identity, so that a modified file is loaded again.
+        stat = os.stat(path)
+        data = _cachedload(
+            os.path.abspath(path),
+            schema,
+            validate,
+            stat.st_mtime_ns,
+            stat.st_size,
+        )
+        return _copy(data)
+
+    with open(path, "rb") as file:
+        data = yaml.load(file, Loader=YAML_LOADER)  # type: ignore
 
     if validate and isinstance(schema, YamlSchema):
-        jsonschema.validate(data, schema.decl)
+        _validate(data, schema.validator)
 
     return data
+
+
+@overload
+def iload(
+    path: str,
+    /,
+    schema: Type[TSCHEMA],
+) -> Iterator[TSCHEMA]: ...
+
+
+@overload
+def iload(
+    path: str,
+    /,
+    schema: YamlSchema[TSCHEMA],
+    *,
+    validate: bool = ...,
+) -> Iterator[TSCHEMA]: ...
+
+
+def iload(
+    path: str,
+    /,
+    schema: YamlSchema[TSCHEMA] | Type[TSCHEMA],
+    *,
+    validate: bool = True,
+) -> Iterator[TSCHEMA]:
+    data: TSCHEMA
+
+    with open(path, "rb") as file:
+        for data in yaml.load_all(file, Loader=YAML_LOADER):
+            if validate and isinstance(schema, YamlSchema):
+                _validate(data, schema.validator)
+
+            yield data
+
+
+def clear_caches() -> None:
+    _cachedload.cache_clear()
+
+
+# ################################ HELPERS #####################################
+
+
+def _validator(decl: Any, /) -> Validator:
+    # Same checks as `jsonschema.validate`, but the schema is only checked
+    # and the validator only built once per schema object.
+    cls = jsonschema.validators.validator_for(decl)
+    cls.check_schema(decl)
+    return cls(decl)
+
+
+def _validate(data: Any, validator: Validator, /) -> None:
+    error = jsonschema.exceptions.best_match(validator.iter_errors(data))
+    if error is not None:
+        raise error
+
+
+@functools.lru_cache(maxsize=CACHE_MAXSIZE)
+def _cachedload(
+    path: str,
+    schema: Any,
+    validate: bool,
+    _mtime_ns: int,
+    _size: int,
+    /,
+) -> Any:
+    return load(path, schema, validate=validate)
+
+
+def _copy(value: T, /) -> T:
+    # Cached results are shared, so their containers are never handed out.
+    _type = type(value)
+    if _type is list:
+        return [_copy(item) for item in value]  # type: ignore
+    elif _type is dict:
+        return {key: _copy(item) for key, item in value.items()}  # type: ignore
+    elif _type is set:
+        return {_copy(item) for item in value}  # type: ignore
+    return value
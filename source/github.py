@@ -1,12 +1,27 @@
+import csv
 import dataclasses
 import functools
+import glob
+import json
+import os
+import os.path
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from types import EllipsisType
 from typing import (
     Any,
+    Callable,
     ClassVar,
+    Dict,
     Final,
-    Self,
+    Iterable,
+    List,
+    Literal,
+    NamedTuple,
+    Tuple,
     Type,
     TypeGuard,
     TypeVar,
@@ -14,8 +29,10 @@ from typing import (
 )
 
 import requests
-from bs4 import BeautifulSoup, ResultSet, Tag
+from bs4 import BeautifulSoup, ResultSet, SoupStrainer, Tag
 from bs4.element import PageElement
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 
 # ################################ PACKAGE #####################################
@@ -35,6 +52,9 @@ __requires__ = (
 __all__ = (
     # fmt: off
     "Repository",
+    "repository", "repositories",
+    "export",
+    "configure_cache", "clear_caches",
     # fmt: on
 )
 
@@ -45,13 +65,38 @@ __all__ = (
 TELEMENT = TypeVar("TELEMENT", bound=PageElement)
 
 
+# ################################ CONSTANTS ###################################
+
+
+GITHUB_URL: Final = "https://github.com"
+
+HTTP_TIMEOUT: Final = 30.0
+HTTP_RETRIES: Final = 5
+HTTP_BACKOFF: Final = 0.5
+HTTP_RETRY_STATUSES: Final = (429, 500, 502, 503, 504)
+HTTP_POOL_MAXSIZE: Final = 32
+
+CACHE_TTL: Final = 24 * 60 * 60.0
+CACHE_MAXSIZE: Final = 1024
+
+LICENSE_UNKNOWN: Final = "..."
+
+EXPORT_FIELDS: Final = (
+    "owner",
+    "name",
+    "desc",
+    "license",
+    "stars",
+    "watchers",
+    "forks",
+)
+
+
 # ################################ TYPES #######################################
 
 
 @dataclass(eq=False, kw_only=True, slots=True)
 class Repository:
-    _cache: ClassVar[Final] = dict[str, Self]()
-
     owner: str = dataclasses.field(init=True, repr=True, kw_only=False)
     name: str = dataclasses.field(init=True, repr=True, kw_only=False)
 
@@ -66,6 +111,14 @@ class Repository:
     forks: int = dataclasses.field(init=False, repr=False)
 
 
+class _Entry(NamedTuple):
+    repo: Repository
+    url: str
+    expires: float
+    etag: str | None
+    modified: str | None
+
+
 # ################################ FUNCTIONS ###################################
 
 
@@ -73,24 +126,162 @@ def repository(
     owner: str,
     name: str,
     *,
+    url: str = GITHUB_URL,
     refresh: bool = False,
 ) -> Repository:
     key = f"{owner}/{name}"
 
-    if refresh:
-        pass
-    elif key in Repository._cache:
-        return Repository._cache[key]
-
-    repo = _scrap.repository(owner, name)
+    entry = _store.get(key, url)
+    if entry is None:
+        headers = {}
+    elif not refresh and entry.expires > time.time():
+        return entry.repo
+    else:
+        # Stale entries are revalidated, and kept if GitHub reports them as
+        # not modified since.
+        headers = {
+            header: value
+            for header, value in (
+                ("If-None-Match", entry.etag),
+                ("If-Modified-Since", entry.modified),
+            )
+            if value is not None
+        }
+
+    response = _scrap.request(owner, name, url=url, headers=headers)
+    if entry is not None and response.status_code == 304:
+        repo = entry.repo
+    else:
+        repo = _scrap.repository(
+            owner,
+            name,
+            soup=_scrap.soup(response.content),
+        )
 
-    Repository._cache[key] = repo
+    _store.put(
+        key,
+        _Entry(
+            repo,
+            url,
+            time.time() + _store.ttl,
+            response.headers.get("ETag", entry and entry.etag),
+            response.headers.get("Last-Modified", entry and entry.modified),
+        ),
+    )
     return repo
 
 
-def clear_caches() -> None:
-    _scrap.invoke.cache_clear()
-    Repository._cache.clear()
+def repositories(
+    pairs: Iterable[Tuple[str, str]],
+    *,
+    url: str = GITHUB_URL,
+    concurrency: int = 8,
+    rate: float | None = None,
+    refresh: bool = False,
+) -> List[Repository | Exception]:
+    _repository = _fetcher(url=url, rate=rate, refresh=refresh)
+
+    # Failures are returned in place of their repository, so that a single
+    # missing repository does not discard all others.
+    def _result(pair: Tuple[str, str]) -> Repository | Exception:
+        try:
+            return _repository(pair)
+        except Exception as exc:
+            return exc
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        return list(executor.map(_result, pairs))
+
+
+def export(
+    names: Iterable[str],
+    file: str,
+    *,
+    format: Literal["jsonl", "csv"] = "jsonl",
+    url: str = GITHUB_URL,
+    concurrency: int = 8,
+    rate: float | None = None,
+    refresh: bool = False,
+    resume: bool = True,
+) -> Dict[str, Exception]:
+    if format != "jsonl" and format != "csv":
+        raise ValueError(f"invalid format: {format!r}")
+
+    exported = _exported(file, format) if resume else set[str]()
+    pending = [
+        (owner, name)
+        for owner, _, name in (
+            str.partition(fullname, "/")
+            for fullname in dict.fromkeys(names)
+            if fullname not in exported
+        )
+    ]
+
+    _repository = _fetcher(url=url, rate=rate, refresh=refresh)
+    failures = dict[str, Exception]()
+
+    def _record(pair: Tuple[str, str]) -> Dict[str, Any] | None:
+        try:
+            return _fields(_repository(pair))
+        except Exception as exc:
+            # Failed repositories are not written, so that a resumed run
+            # retries them.
+            failures[str.join("/", pair)] = exc
+            return None
+
+    with (
+        open(
+            file,
+            ("a" if exported else "w"),
+            encoding="utf-8",
+            newline="",
+        ) as fp,
+        ThreadPoolExecutor(max_workers=concurrency) as executor,
+    ):
+        if format == "csv":
+            writer = csv.DictWriter(fp, EXPORT_FIELDS, lineterminator="\n")
+            if not exported:
+                writer.writeheader()
+            write = writer.writerow
+        else:
+
+            def write(record: Dict[str, Any], /) -> None:
+                fp.write(json.dumps(record) + "\n")
+
+        for record in executor.map(_record, pending):
+            if record is not None:
+                write(record)
+                fp.flush()
+
+    return failures
+
+
+def configure_cache(
+    path: str | None = None,
+    *,
+    ttl: float = CACHE_TTL,
+    maxsize: int = CACHE_MAXSIZE,
+) -> None:
+    with _store.lock:
+        _store.path = path
+        _store.ttl = ttl
+        _store.maxsize = maxsize
+        while len(_store.memory) > maxsize:
+            _store.memory.popitem(last=False)
+
+
+def clear_caches(*, persistent: bool = False) -> None:
+    with _store.lock:
+        _store.memory.clear()
+        if persistent and _store.path is not None:
+            # Repositories may be hidden (e.g. ".github"), and temporary files
+            # are left behind by interrupted writes.
+            for pattern in ("*.json", "*.tmp"):
+                for file in glob.iglob(
+                    os.path.join(_store.path, "*", pattern),
+                    include_hidden=True,
+                ):
+                    os.remove(file)
 
 
 # ################################ INTERNALS ###################################
@@ -99,16 +290,67 @@ def clear_caches() -> None:
 class _scrap:
 
     @staticmethod
-    @functools.lru_cache(maxsize=1)
-    def invoke(owner: str, name: str) -> BeautifulSoup:
-        _request = requests.request(
-            "GET",
-            f"https://github.com/{owner}/{name}",
+    def invoke(
+        owner: str,
+        name: str,
+        *,
+        url: str = GITHUB_URL,
+    ) -> BeautifulSoup:
+        return _scrap.soup(_scrap.request(owner, name, url=url).content)
+
+    strainer_sidebar: Final = SoupStrainer("div", class_="Layout-sidebar")
+
+    @staticmethod
+    def soup(content: bytes, /, *, sidebar: bool = True) -> BeautifulSoup:
+        # Only the sidebar holds the repository metadata, so the rest of the
+        # page is tokenized but never built into a tree.
+        return BeautifulSoup(
+            content,
+            "lxml",
+            parse_only=(_scrap.strainer_sidebar if sidebar else None),
+        )
+
+    @staticmethod
+    def request(
+        owner: str,
+        name: str,
+        *,
+        url: str = GITHUB_URL,
+        headers: Dict[str, str] | None = None,
+    ) -> requests.Response:
+        _request = _scrap.session().get(
+            f"{url.rstrip('/')}/{owner}/{name}",
+            headers=headers,
+            timeout=HTTP_TIMEOUT,
         )
         if _request.status_code == 404:
             raise LookupError(...)
+        _request.raise_for_status()
+
+        return _request
+
+    @staticmethod
+    @functools.cache
+    def session() -> requests.Session:
+        # Shared by all threads: connections are kept alive in the pool, and
+        # throttled or failing requests are retried with exponential backoff.
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=HTTP_POOL_MAXSIZE,
+            max_retries=Retry(
+                total=HTTP_RETRIES,
+                backoff_factor=HTTP_BACKOFF,
+                status_forcelist=HTTP_RETRY_STATUSES,
+                allowed_methods=frozenset({"GET"}),
+                respect_retry_after_header=True,
+                raise_on_status=False,
+            ),
+        )
 
-        return BeautifulSoup(_request.content, "lxml")
+        session = requests.Session()
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
 
     css_repository_about: Final = (
         "#repo-content-pjax-container > div > div > div"
@@ -116,6 +358,10 @@ class _scrap:
         " > div"
     )
 
+    css_sidebar_about: Final = (
+        "div.Layout-sidebar > div > div:nth-child(1) > div > div"
+    )
+
     @classmethod
     def repository(
         cls,
@@ -129,6 +375,8 @@ class _scrap:
         soup = soup or cls.invoke(owner, name)
 
         _about = soup.select_one(cls.css_repository_about)
+        if _about is None:
+            _about = soup.select_one(cls.css_sidebar_about)
         if _about is None:
             raise ValueError(...)
 
@@ -226,9 +474,192 @@ class _scrap:
         return int(float(text) * scaler)
 
 
+class _store:
+    lock: Final = threading.Lock()
+    memory: Final = OrderedDict[str, _Entry]()
+
+    path: ClassVar[str | None] = None
+    ttl: ClassVar[float] = CACHE_TTL
+    maxsize: ClassVar[int] = CACHE_MAXSIZE
+
+    @classmethod
+    def get(cls, key: str, url: str, /) -> _Entry | None:
+        with cls.lock:
+            entry = cls.memory.get(key)
+            if entry is not None:
+                cls.memory.move_to_end(key)
+
+        if entry is None:
+            entry = cls.load(key)
+            if entry is not None:
+                cls.remember(key, entry)
+
+        # Entries are kept per repository, so that those scraped from other
+        # hosts are treated as cache misses.
+        return entry if entry is not None and entry.url == url else None
+
+    @classmethod
+    def put(cls, key: str, entry: _Entry, /) -> None:
+        cls.remember(key, entry)
+        cls.dump(key, entry)
+
+    @classmethod
+    def remember(cls, key: str, entry: _Entry, /) -> None:
+        with cls.lock:
+            cls.memory[key] = entry
+            cls.memory.move_to_end(key)
+            while len(cls.memory) > cls.maxsize:
+                cls.memory.popitem(last=False)
+
+    @classmethod
+    def file(cls, key: str, /) -> str | None:
+        if cls.path is None:
+            return None
+
+        # Keys are joined into paths, which must stay within the cache.
+        segments = key.split("/")
+        if len(segments) != 2 or any(
+            segment in ("", os.curdir, os.pardir)
+            or (os.altsep is not None and os.altsep in segment)
+            or os.sep in segment
+            or os.path.splitdrive(segment)[0]
+            for segment in segments
+        ):
+            raise ValueError(f"invalid repository: {key!r}")
+        return os.path.join(cls.path, *segments) + ".json"
+
+    @classmethod
+    def load(cls, key: str, /) -> _Entry | None:
+        file = cls.file(key)
+        if file is None:
+            return None
+
+        try:
+            with open(file, "r", encoding="utf-8") as fp:
+                data = json.load(fp)
+
+            repo = Repository(data["owner"], data["name"])
+            for field, value in data["fields"].items():
+                if field == "license" and value == LICENSE_UNKNOWN:
+                    value = Ellipsis
+                setattr(repo, field, value)
+
+            return _Entry(
+                repo,
+                data["url"],
+                data["expires"],
+                data["etag"],
+                data["modified"],
+            )
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            # Missing or unreadable entries are treated as cache misses.
+            return None
+
+    @classmethod
+    def dump(cls, key: str, entry: _Entry, /) -> None:
+        file = cls.file(key)
+        if file is None:
+            return
+
+        fields = {
+            field: value
+            for field, value in _fields(entry.repo).items()
+            if field not in ("owner", "name") and hasattr(entry.repo, field)
+        }
+
+        data = {
+            "owner": entry.repo.owner,
+            "name": entry.repo.name,
+            "fields": fields,
+            "url": entry.url,
+            "expires": entry.expires,
+            "etag": entry.etag,
+            "modified": entry.modified,
+        }
+
+        # Written to a temporary file first so that concurrent readers never
+        # see a partially written entry.
+        os.makedirs(os.path.dirname(file), exist_ok=True)
+        tempfile = f"{file}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tempfile, "w", encoding="utf-8") as fp:
+            json.dump(data, fp)
+        os.replace(tempfile, file)
+
+
 # ################################ HELPERS #####################################
 
 
+def _fetcher(
+    *,
+    url: str,
+    rate: float | None,
+    refresh: bool,
+) -> Callable[[Tuple[str, str]], Repository]:
+    throttle = _throttle(rate)
+
+    def _repository(pair: Tuple[str, str]) -> Repository:
+        owner, name = pair
+        entry = None if refresh else _store.get(f"{owner}/{name}", url)
+        if entry is not None and entry.expires > time.time():
+            return entry.repo
+
+        throttle()
+        return repository(owner, name, url=url, refresh=refresh)
+
+    return _repository
+
+
+def _fields(repo: Repository, /) -> Dict[str, Any]:
+    fields = dict[str, Any]()
+    for field in dataclasses.fields(Repository):
+        value = getattr(repo, field.name, None)
+        if value is Ellipsis:
+            value = LICENSE_UNKNOWN
+        fields[field.name] = value
+    return fields
+
+
+def _exported(file: str, format: str, /) -> set[str]:
+    try:
+        fp = open(file, "r+", encoding="utf-8", newline="")
+    except FileNotFoundError:
+        return set()
+
+    with fp:
+        content = fp.read()
+        # A record interrupted mid-write is dropped, and rewritten once its
+        # repository is exported again.
+        content = content[: content.rfind("\n") + 1]
+        fp.truncate(len(content.encode("utf-8")))
+
+    lines = [line + "\n" for line in content.split("\n")[:-1]]
+    if format == "csv":
+        records = csv.DictReader(lines)
+    else:
+        records = map(json.loads, lines)
+    return {f"{record['owner']}/{record['name']}" for record in records}
+
+
+def _throttle(rate: float | None, /) -> Callable[[], None]:
+    if not rate:
+        return lambda: None
+
+    interval = 1.0 / rate
+    lock = threading.Lock()
+    deadline = time.monotonic()
+
+    def _wait() -> None:
+        nonlocal deadline
+        with lock:
+            now = time.monotonic()
+            delay = deadline - now
+            deadline = max(deadline, now) + interval
+        if delay > 0:
+            time.sleep(delay)
+
+    return _wait
+
+
 @overload
 def is_result_set(
     obj: Any,
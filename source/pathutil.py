@@ -2,7 +2,10 @@ import fnmatch as _internalfnmatch
 import glob as _internalglob
 import os
 import os.path
-from typing import Iterable, Sequence
+import sys
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Iterable, Iterator, List, Self, Sequence, Tuple
 
 
 # ################################ PACKAGE #####################################
@@ -15,7 +18,163 @@ __description__ = ...
 __requires__ = ()
 
 
-__all__ = ()
+__all__ = (
+    # fmt: off
+    "NormPath",
+    # fmt: on
+)
+
+
+# ################################ TYPES #######################################
+
+
+class NormPath:
+    # ################## FIELDS ############################
+
+    __slots__ = (
+        "path",
+        "drive",
+        "dirname",
+        "basename",
+        "filename",
+        "fileext",
+    )
+
+    path: str
+    """Normalized full path."""
+
+    drive: str
+    """Drive of the path (interned)."""
+    dirname: str
+    """Directory of the path (interned)."""
+    basename: str
+    """Final component of the path."""
+    filename: str
+    """Final component of the path without extension."""
+    fileext: str
+    """Extension of the final component (interned)."""
+
+    # ################## STRUCTORS #########################
+
+    def __init__(
+        self,
+        *paths: str,
+        basepath: str | None = None,
+    ) -> None:
+        fullpath = normpath(*paths, basepath=basepath)
+        self._split(fullpath)
+
+    @classmethod
+    def _fromnorm(cls, fullpath: str, /) -> Self:
+        self = cls.__new__(cls)
+        self._split(fullpath)
+        return self
+
+    def _split(self, fullpath: str, /) -> None:
+        drive, _ = os.path.splitdrive(fullpath)
+        dirname, basename = os.path.split(fullpath)
+        filename, fileext = os.path.splitext(basename)
+
+        # Instances are hashed by their path, so fields are only set once.
+        object.__setattr__(self, "path", fullpath)
+        object.__setattr__(self, "drive", sys.intern(drive))
+        object.__setattr__(self, "dirname", sys.intern(dirname))
+        object.__setattr__(self, "basename", basename)
+        object.__setattr__(self, "filename", filename)
+        object.__setattr__(self, "fileext", sys.intern(fileext))
+
+    # ################## METHODS ###########################
+
+    def parent(self) -> Self:
+        # Relative paths without a directory are relative to the current one.
+        return type(self)._fromnorm(self.dirname or os.curdir)
+
+    def replace(
+        self,
+        *,
+        drive: str | None = None,
+        subpath: str | None = None,
+        dirname: str | None = None,
+        basename: str | None = None,
+        filename: str | None = None,
+        fileext: str | None = None,
+    ) -> Self:
+        if drive is not None or subpath is not None:
+            return type(self)(
+                replace(
+                    self.path,
+                    drive=drive,
+                    subpath=subpath,
+                    dirname=dirname,
+                    basename=basename,
+                    filename=filename,
+                    fileext=fileext,
+                )
+            )
+
+        if (
+            dirname is None
+            and basename is None
+            and filename is None
+            and fileext is None
+        ):
+            return self
+
+        dirname_ = (
+            os.path.join(self.drive, dirname)
+            if dirname is not None
+            else self.dirname
+            # <format-break>
+        )
+
+        if basename is not None:
+            filename_, fileext_ = os.path.splitext(basename)
+        else:
+            filename_, fileext_ = self.filename, self.fileext
+
+        basename_ = (
+            (filename if filename is not None else filename_)
+            + (fileext if fileext is not None else fileext_)
+            # <format-break>
+        )
+
+        return type(self)(dirname_, basename_)
+
+    # ################## PROTOCOLS #########################
+
+    def __fspath__(self) -> str:
+        return self.path
+
+    def __str__(self) -> str:
+        return self.path
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.path!r})"
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, NormPath):
+            return self.path == other.path
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self.path)
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return (type(self)._fromnorm, (self.path,))
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(
+            f"{type(self).__name__!r} object is immutable",
+            name=name,
+            obj=self,
+        )
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(
+            f"{type(self).__name__!r} object is immutable",
+            name=name,
+            obj=self,
+        )
 
 
 # ################################ FUNCTIONS ###################################
@@ -28,7 +187,8 @@ def _path(
     _path = os.path.join(*paths)
     if basepath and not os.path.isabs(_path):
         _path = os.path.join(basepath, _path)
-    return _path.rstrip(os.sep)
+    # Trailing separators are removed, except for the root itself.
+    return _path.rstrip(os.sep) or _path[:1]
 
 
 # ###################### COMBINATION #######################
@@ -227,7 +387,7 @@ def replace(
             filename_ = filename if filename is not None else filename_
             fileext_ = fileext if fileext is not None else fileext_
 
-            return os.path.join(drive_, dirname_, filename_, fileext_)
+            return os.path.join(drive_, dirname_, filename_ + fileext_)
 
         return os.path.join(drive_, dirname_, basename_)
 
@@ -242,51 +402,160 @@ def hidden(*paths: str):
 # ###################### COLLECTION #########################
 
 
-def _glob(
+def _iglob(
     paths: Iterable[str],
     basepath: str | None,
     *,
     recursive: bool,
-) -> Sequence[str]:
+    workers: int | None,
+) -> Iterator[str]:
     fullpath = normpath(*paths, basepath=basepath)
-    return _internalglob.glob(fullpath, recursive=recursive)
+
+    rootpattern, subpattern = _globsplit(fullpath)
+    if not workers or not subpattern:
+        yield from _internalglob.iglob(fullpath, recursive=recursive)
+        return
+
+    def _rootglob(root: str) -> List[str]:
+        return _internalglob.glob(
+            os.path.join(_internalglob.escape(root), subpattern),
+            recursive=recursive,
+        )
+
+    roots = _internalglob.iglob(rootpattern, recursive=recursive)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        # Only a bounded number of roots is globbed ahead of the consumer.
+        pending = deque[Future[List[str]]]()
+        while True:
+            root = next(roots, None)
+            if root is not None:
+                pending.append(executor.submit(_rootglob, root))
+            if not pending:
+                return
+            if root is not None and len(pending) < 2 * workers:
+                continue
+
+            yield from pending.popleft().result()
+
+
+def _globsplit(fullpath: str, /) -> Tuple[str, str | None]:
+    pathitems = fullpath.split(os.sep)
+    for index, item in enumerate(pathitems):
+        if item == "**":
+            break
+        elif _internalglob.has_magic(item):
+            if index + 1 < len(pathitems):
+                return (
+                    str.join(os.sep, pathitems[: index + 1]) or os.sep,
+                    str.join(os.sep, pathitems[index + 1 :]),
+                )
+            break
+    return fullpath, None
+
+
+def inormglob(
+    *paths: str,
+    basepath: str | None = None,
+    recursive: bool = False,
+    workers: int | None = None,
+) -> Iterator[str]:
+    globpaths = _iglob(paths, basepath, recursive=recursive, workers=workers)
+    return map(os.path.normpath, globpaths)
+
+
+def iabsglob(
+    *paths: str,
+    basepath: str | None = None,
+    recursive: bool = False,
+    workers: int | None = None,
+) -> Iterator[str]:
+    globpaths = _iglob(paths, basepath, recursive=recursive, workers=workers)
+    return map(os.path.abspath, globpaths)
+
+
+def irealglob(
+    *paths: str,
+    basepath: str | None = None,
+    recursive: bool = False,
+    workers: int | None = None,
+) -> Iterator[str]:
+    globpaths = _iglob(paths, basepath, recursive=recursive, workers=workers)
+    return map(os.path.realpath, globpaths)
+
+
+def irelglob(
+    *paths_and_start: str,
+    basepath: str | None = None,
+    recursive: bool = False,
+    workers: int | None = None,
+) -> Iterator[str]:
+    *paths, start = paths_and_start
+    globpaths = _iglob(paths, basepath, recursive=recursive, workers=workers)
+    return (os.path.relpath(path, start) for path in globpaths)
 
 
 def normglob(
     *paths: str,
     basepath: str | None = None,
     recursive: bool = False,
+    workers: int | None = None,
 ) -> Sequence[str]:
-    globpaths = _glob(paths, basepath, recursive=recursive)
-    return [os.path.normpath(path) for path in globpaths]
+    return list(
+        inormglob(
+            *paths,
+            basepath=basepath,
+            recursive=recursive,
+            workers=workers,
+        )
+    )
 
 
 def absglob(
     *paths: str,
     basepath: str | None = None,
     recursive: bool = False,
+    workers: int | None = None,
 ) -> Sequence[str]:
-    globpaths = _glob(paths, basepath, recursive=recursive)
-    return [os.path.abspath(path) for path in globpaths]
+    return list(
+        iabsglob(
+            *paths,
+            basepath=basepath,
+            recursive=recursive,
+            workers=workers,
+        )
+    )
 
 
 def realglob(
     *paths: str,
     basepath: str | None = None,
     recursive: bool = False,
+    workers: int | None = None,
 ) -> Sequence[str]:
-    globpaths = _glob(paths, basepath, recursive=recursive)
-    return [os.path.realpath(path) for path in globpaths]
+    return list(
+        irealglob(
+            *paths,
+            basepath=basepath,
+            recursive=recursive,
+            workers=workers,
+        )
+    )
 
 
 def relglob(
     *paths_and_start: str,
     basepath: str | None = None,
     recursive: bool = False,
+    workers: int | None = None,
 ) -> Sequence[str]:
-    *paths, start = paths_and_start
-    globpaths = _glob(paths, basepath, recursive=recursive)
-    return [os.path.relpath(path, start) for path in globpaths]
+    return list(
+        irelglob(
+            *paths_and_start,
+            basepath=basepath,
+            recursive=recursive,
+            workers=workers,
+        )
+    )
 
 
 # ###################### PRESENTATION #######################
@@ -0,0 +1,113 @@
+import collections
+import timeit
+from typing import Any, Callable, Dict, List
+
+import caststr
+
+from tests import asset
+
+
+__TESTEE__ = "caststr"
+
+
+# ################################ BENCHMARKS ##################################
+
+
+def reference(s: str, /, *, _depth: int = 0) -> Any:  # noqa: C901
+    # Classifier before the single scan, where every kind is tried in turn.
+    # Splitting is shared, so that only the classification differs.
+    if s.lower() in caststr.NONE_MAPPED_VALUES:
+        return None
+
+    if s.lower() in caststr.FALSE_MAPPED_VALUES:
+        return False
+    if s.lower() in caststr.TRUE_MAPPED_VALUES:
+        return True
+
+    intbase = caststr.INT_BASE_INDICATORS.get(s[1:2], 10)
+    try:
+        return int(s, intbase)
+    except ValueError:
+        pass
+
+    try:
+        return float(s)
+    except ValueError:
+        pass
+
+    try:
+        return complex(s)
+    except ValueError:
+        pass
+
+    try:
+        _mapping = list(caststr._resolve.mapping(s))
+    except ValueError:
+        pass
+    else:
+        return {
+            reference(keystr, _depth=(_depth + 1)): reference(
+                valuestr, _depth=(_depth + 1)
+            )
+            for keystr, valuestr in _mapping
+        }
+
+    try:
+        _sequence = list(caststr._resolve.sequence(s, nodelim=(_depth == 0)))
+    except ValueError:
+        pass
+    else:
+        return [reference(itemstr, _depth=(_depth + 1)) for itemstr in _sequence]
+
+    return s
+
+
+def bench(
+    strings: List[str],
+    resolvers: Dict[str, Callable[[str], Any]],
+    /,
+    *,
+    repeat: int = 5,
+) -> None:
+    # Compared by representation, so that NaN and the types of numbers count.
+    expected = [repr(reference(s)) for s in strings]
+    for label, resolver in resolvers.items():
+        if list(map(repr, map(resolver, strings))) != expected:
+            raise AssertionError(f"different results: {label}")
+
+        seconds = min(
+            timeit.repeat(
+                lambda resolver=resolver: list(map(resolver, strings)),
+                number=1,
+                repeat=repeat,
+            )
+        )
+        usec = seconds / len(strings) * 1e6
+        print(f"  {label:<12} {usec:8.2f} us/string")
+
+
+def main() -> None:
+    with open(asset("inputs", "mixed.txt"), "r", encoding="utf-8") as fp:
+        strings = fp.read().splitlines()
+
+    # Kinds are told apart by the type of their resolved values.
+    kinds = collections.defaultdict[str, List[str]](list)
+    for s in strings:
+        kinds[type(caststr.resolve(s)).__name__].append(s)
+
+    resolvers = {
+        "reference": reference,
+        "resolve": caststr.resolve,
+        "compile": caststr.compile(Any),
+        "cached": lambda s: caststr.resolve(s, cache=True),
+    }
+
+    print(f"mixed ({len(strings)} strings)")
+    bench(strings, resolvers)
+    for kind, kindstrings in sorted(kinds.items()):
+        print(f"{kind} ({len(kindstrings)} strings)")
+        bench(kindstrings, resolvers)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+import json
+import timeit
+from typing import Any, Callable, Dict
+
+import fjson
+
+from tests import asset
+
+
+__TESTEE__ = "fjson"
+
+
+# ################################ BENCHMARKS ##################################
+
+
+def bench(
+    expected: Any,
+    loaders: Dict[str, Callable[[], Any]],
+    /,
+) -> None:
+    for label, loader in loaders.items():
+        if loader() != expected:
+            raise AssertionError(f"different results: {label}")
+
+        seconds = min(timeit.repeat(loader, number=10, repeat=5))
+        print(f"  {label:<12} {seconds / 10 * 1e3:8.2f} ms/file")
+
+
+def main() -> None:
+    if fjson.orjson is None:
+        print("orjson is not installed, fjson uses the json module")
+
+    path = asset("documents", "packages.json")
+    with open(path, "rb") as fp:
+        expected = json.loads(fp.read().decode("utf-8"))
+
+    def _json() -> Any:
+        with open(path, "rb") as fp:
+            return json.loads(fp.read().decode("utf-8"))
+
+    print("packages.json")
+    bench(
+        expected,
+        {
+            "json": _json,
+            "fjson": lambda: fjson.load(path, dict),
+            "fjson/mmap": lambda: fjson.load(path, dict, mmap=True),
+        },
+    )
+
+    path = asset("documents", "packages.jsonl")
+    with open(path, "r", encoding="utf-8") as fp:
+        expected = list(map(json.loads, fp))
+
+    def _jsonl() -> Any:
+        with open(path, "r", encoding="utf-8") as fp:
+            return list(map(json.loads, fp))
+
+    print("packages.jsonl")
+    bench(
+        expected,
+        {
+            "json": _jsonl,
+            "fjson": lambda: list(fjson.iload(path, dict)),
+            "fjson/concat": lambda: list(
+                fjson.iload(path, dict, concatenated=True)
+            ),
+        },
+    )
+
+
+if __name__ == "__main__":
+    main()
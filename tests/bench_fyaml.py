@@ -0,0 +1,54 @@
+import glob
+import os.path
+import timeit
+from typing import Any, Dict
+
+import fyaml
+import yaml
+
+from tests import asset
+
+
+__TESTEE__ = "fyaml"
+
+
+# ################################ BENCHMARKS ##################################
+
+
+def load(file: str, /, loader: Any, *, stream: bool) -> Any:
+    with open(file, "rb") as fp:
+        if stream:
+            return list(yaml.load_all(fp, Loader=loader))
+        return list(yaml.load_all(fp.read().decode("utf-8"), Loader=loader))
+
+
+def main() -> None:
+    paths: Dict[str, Dict[str, Any]] = {
+        "python": {"loader": yaml.SafeLoader, "stream": False},
+        "python/io": {"loader": yaml.SafeLoader, "stream": True},
+        "fyaml": {"loader": fyaml.YAML_LOADER, "stream": True},
+    }
+
+    if fyaml.YAML_LOADER is yaml.SafeLoader:
+        print("libyaml is not available, fyaml uses the Python loader")
+
+    for file in sorted(glob.glob(asset("manifests", "*.yaml"))):
+        print(f"{os.path.basename(file)} ({os.path.getsize(file) // 1024} KiB)")
+
+        expected = load(file, **paths["python"])
+        for label, kwargs in paths.items():
+            if load(file, **kwargs) != expected:
+                raise AssertionError(f"different results: {label}")
+
+            seconds = min(
+                timeit.repeat(
+                    lambda file=file, kwargs=kwargs: load(file, **kwargs),
+                    number=1,
+                    repeat=5,
+                )
+            )
+            print(f"  {label:<12} {seconds * 1e3:8.2f} ms/file")
+
+
+if __name__ == "__main__":
+    main()
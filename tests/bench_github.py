@@ -0,0 +1,47 @@
+import glob
+import os.path
+import timeit
+from typing import Any, Dict
+
+import github
+
+from tests import asset
+
+
+__TESTEE__ = "github"
+
+
+# ################################ BENCHMARKS ##################################
+
+
+def scrap(content: bytes, /, *, sidebar: bool) -> Dict[str, Any]:
+    soup = github._scrap.soup(content, sidebar=sidebar)
+    return github._fields(github._scrap.repository("", "", soup=soup))
+
+
+def main() -> None:
+    for file in sorted(glob.glob(asset("pages", "*", "*.html"))):
+        with open(file, "rb") as fp:
+            content = fp.read()
+
+        page = os.path.relpath(file, os.path.dirname(os.path.dirname(file)))
+        print(f"{page} ({len(content) // 1024} KiB)")
+
+        if scrap(content, sidebar=True) != scrap(content, sidebar=False):
+            raise AssertionError(f"different results: {page}")
+
+        for label, sidebar in (("full", False), ("sidebar", True)):
+            seconds = min(
+                timeit.repeat(
+                    lambda content=content, sidebar=sidebar: scrap(
+                        content, sidebar=sidebar
+                    ),
+                    number=10,
+                    repeat=5,
+                )
+            )
+            print(f"  {label:<12} {seconds / 10 * 1e3:8.2f} ms/page")
+
+
+if __name__ == "__main__":
+    main()
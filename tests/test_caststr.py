@@ -0,0 +1,296 @@
+import dataclasses
+from typing import (
+    Annotated,
+    Any,
+    Dict,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    Union,
+)
+
+import caststr
+import pytest
+
+
+# ################################ RESOLVE #####################################
+
+
+@pytest.mark.parametrize(
+    "s, expected",
+    [
+        ("true", True),
+        ("No", False),
+        ("none", None),
+        ("NULL", None),
+        ("-12", -12),
+        ("0x1f", 31),
+        ("1_000", 1000),
+        ("1.5", 1.5),
+        ("1e3", 1000.0),
+        ("1+2j", 1 + 2j),
+        ("(3-4j)", 3 - 4j),
+        ("abc", "abc"),
+        ("a:b", "a:b"),
+        ("[1,2]", [1, 2]),
+        ("(1,2)", [1, 2]),
+        ("1,2", [1, 2]),
+        ("a,b,", ["a", "b"]),
+        ("[ 1 , 2 ]", [1, 2]),
+        ("[a,(b,c)]", ["a", ["b", "c"]]),
+        ("[1,[2,[3]]]", [1, [2, [3]]]),
+        ("[(1+2j),((1,2),3)]", [1 + 2j, [[1, 2], 3]]),
+        ("{a:1,b:[2,3]}", {"a": 1, "b": [2, 3]}),
+        ("{k:v:w}", {"k": "v:w"}),
+    ],
+)
+def test_resolve(s: str, expected: Any) -> None:
+    assert repr(caststr.resolve(s)) == repr(expected)
+    assert repr(caststr.compile()(s)) == repr(expected)
+
+
+@pytest.mark.parametrize(
+    "s, type, expected",
+    [
+        ("1", float, 1.0),
+        ("yes", bool, True),
+        ("abc", bytes, b"abc"),
+        ("none", Optional[int], None),
+        ("3", Optional[int], 3),
+        ("1", Union[str, int], "1"),
+        ("1", Union[int, str], 1),
+        ("1,2", List[int], [1, 2]),
+        ("[[1],[2,3]]", List[List[int]], [[1], [2, 3]]),
+        ("(1,a)", Tuple[int, str], (1, "a")),
+        ("[1,2,3]", Tuple[int, ...], (1, 2, 3)),
+        ("{a:[1,2]}", Dict[str, List[int]], {"a": [1, 2]}),
+        ("[1,x]", List[Union[int, str]], [1, "x"]),
+    ],
+)
+def test_resolve_typed(s: str, type: Any, expected: Any) -> None:
+    assert repr(caststr.resolve(s, type)) == repr(expected)
+    assert repr(caststr.compile(type)(s)) == repr(expected)
+
+
+@pytest.mark.parametrize(
+    "s, type",
+    [
+        ("x", int),
+        ("1", None),
+        ("maybe", bool),
+        ("[1,x]", List[int]),
+        ("[1,2]", Tuple[int]),
+        ("[1", List[int]),
+        ("{a}", Dict[str, str]),
+    ],
+)
+def test_resolve_invalid(s: str, type: Any) -> None:
+    with pytest.raises(ValueError):
+        caststr.resolve(s, type)
+    with pytest.raises(ValueError):
+        caststr.compile(type)(s)
+
+
+def test_resolve_nested() -> None:
+    depth = 200
+    s = "[" * depth + "1" + "]" * depth
+
+    value = caststr.resolve(s)
+    for _ in range(depth):
+        (value,) = value
+    assert value == 1
+
+
+def test_resolve_cache() -> None:
+    caststr.clear_caches()
+    first = caststr.resolve("[1,[2]]", cache=True)
+    first[1].append(3)
+    second = caststr.resolve("[1,[2]]", cache=True)
+
+    assert second == [1, [2]]
+    assert caststr.cache_info().hits == 1
+
+
+def test_resolve_cache_errors(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls = list[str]()
+    call = caststr._resolve.call
+
+    def _call(s: str, type: Any, **kwargs: Any) -> Any:
+        calls.append(s)
+        return call(s, type, **kwargs)
+
+    monkeypatch.setattr(caststr._resolve, "call", _call)
+    with pytest.raises(TypeError):
+        caststr.resolve("a", Literal["a"], cache=True)
+    assert calls == ["a"]
+
+    # Unhashable types are still resolved, without the cache.
+    assert caststr.resolve("1", Annotated[int, {}], cache=True) == 1
+
+
+def test_resize_cache() -> None:
+    try:
+        caststr.resize_cache(2)
+        for s in ("1", "2", "3"):
+            caststr.resolve(s, cache=True)
+        assert caststr.cache_info().currsize == 2
+    finally:
+        caststr.resize_cache(caststr.RESOLVE_CACHE_MAXSIZE)
+
+
+def test_compile_cache() -> None:
+    caststr.compile(list[int])
+    currsize = caststr._compile.cached.cache_info().currsize
+    for _ in range(10):
+        caststr.compile(list[int])("[1]")
+
+    assert caststr._compile.cached.cache_info().currsize == currsize
+
+
+def test_register() -> None:
+    assert caststr.resolve("ja", cache=True) == "ja"
+    caststr.register("ja", value=True)
+    try:
+        assert caststr.resolve("ja", cache=True) is True
+        assert caststr.istrue("JA")
+    finally:
+        del caststr.MAPPED_VALUES["ja"]
+        caststr.clear_caches()
+
+
+@pytest.mark.parametrize(
+    "s, none, true, false",
+    [
+        ("", True, False, False),
+        ("null", True, False, False),
+        ("YES", False, True, False),
+        ("off", False, False, True),
+        ("maybe", False, False, False),
+    ],
+)
+def test_predicates(s: str, none: bool, true: bool, false: bool) -> None:
+    assert caststr.isnone(s) is none
+    assert caststr.istrue(s) is true
+    assert caststr.isfalse(s) is false
+    assert caststr.isbool(s) is (true or false)
+
+
+# ################################ RESOLVE MANY ################################
+
+
+@pytest.mark.parametrize("type", [int, float, bool, str, Optional[int]])
+def test_resolve_many(type: Any) -> None:
+    strings = ["1", "0", "1"] if type is not bool else ["yes", "no", "on"]
+    expected = [caststr.resolve(s, type) for s in strings]
+
+    assert list(caststr.resolve_many(strings, type)) == expected
+    assert list(caststr.resolve_many(iter(strings), type)) == expected
+
+
+@pytest.mark.parametrize(
+    "type, indices",
+    [
+        (caststr._UNSET, [1]),
+        (int, [0, 1, 2]),
+        (List[int], [1, 2]),
+    ],
+)
+def test_resolve_many_errors(type: Any, indices: List[int]) -> None:
+    with pytest.raises(caststr.ResolveError) as excinfo:
+        caststr.resolve_many(["[1]", "", "x"], type)
+
+    assert list(excinfo.value.errors) == indices
+    assert all(
+        isinstance(error, ValueError)
+        for error in excinfo.value.errors.values()
+    )
+
+
+# ################################ ENVIRON #####################################
+
+
+@dataclasses.dataclass
+class _Environ:
+    hosts: List[str]
+    port: int = 80
+    debug: bool = False
+
+
+def test_environ() -> None:
+    values = caststr.environ(
+        _Environ,
+        prefix="APP_",
+        source={"APP_HOSTS": "a,b", "APP_DEBUG": "on", "HOSTS": "c"},
+    )
+
+    assert values == _Environ(hosts=["a", "b"], port=80, debug=True)
+
+
+def test_environ_missing() -> None:
+    with pytest.raises(KeyError):
+        caststr.environ(_Environ, source={"PORT": "8080"})
+
+
+@pytest.mark.parametrize("hosts", ["", "[a"])
+def test_environ_invalid(hosts: str) -> None:
+    with pytest.raises(ValueError, match="invalid HOSTS"):
+        caststr.environ(_Environ, source={"HOSTS": hosts})
+
+
+# ################################ DUMPS #######################################
+
+
+@pytest.mark.parametrize(
+    "value, type",
+    [
+        (1, caststr._UNSET),
+        ([1, "a", None, True], caststr._UNSET),
+        ({"a": [1, 2.5]}, caststr._UNSET),
+        ("x", str),
+        ((1, "a"), Tuple[int, str]),
+        ({"k": 1 + 2j}, Dict[str, complex]),
+        (None, Optional[int]),
+        (b"ab", bytes),
+        (b"ab", Union[bytes, str]),
+        (["a", 1], List[Any]),
+        ({"k": ["x", 1]}, Dict[str, Any]),
+    ],
+)
+def test_dumps(value: Any, type: Any) -> None:
+    s = caststr.dumps(value, type)
+
+    assert repr(caststr.resolve(s, type)) == repr(value)
+
+
+@pytest.mark.parametrize(
+    "value, type",
+    [
+        ("a,b", caststr._UNSET),
+        ([], List[int]),
+        (1, Union[str, int]),
+        ("a", Union[bytes, str]),
+        (["a,b"], List[str]),
+        (["a,b"], List[Any]),
+        (["(a"], List[Any]),
+        ({"k": "x,y"}, Dict[str, Any]),
+        ({"a:b": 1}, Dict[Any, int]),
+    ],
+)
+def test_dumps_unrepresentable(value: Any, type: Any) -> None:
+    with pytest.raises(ValueError):
+        caststr.dumps(value, type)
+
+
+@pytest.mark.parametrize(
+    "value, type",
+    [
+        ("a", bytes),
+        (b"a", str),
+        ([1], Tuple[int, ...]),
+        ({"a": "1"}, Dict[str, int]),
+    ],
+)
+def test_dumps_invalid(value: Any, type: Any) -> None:
+    with pytest.raises(TypeError):
+        caststr.dumps(value, type)
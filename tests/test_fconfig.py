@@ -0,0 +1,49 @@
+import fconfig
+import fjson
+import jsonschema
+import pytest
+
+from tests import asset
+
+
+# ################################ LOAD MANY ###################################
+
+
+DATA = {"name": "app", "port": 8080, "debug": True, "hosts": ["alpha", "beta"]}
+
+
+@pytest.mark.parametrize("workers", [None, 2])
+def test_load_many(workers: int | None) -> None:
+    paths = [
+        asset("configs", "app.json"),
+        asset("configs", "app.toml"),
+        asset("configs", "app.yaml"),
+        asset("configs", "app.ini"),
+    ]
+
+    results = fconfig.load_many(paths, dict, workers=workers)
+
+    assert results[:3] == [DATA, DATA, DATA]
+    assert results[3] == {"server": {"name": "app", "port": "8080"}}
+
+
+@pytest.mark.parametrize("workers", [None, 2])
+def test_load_many_errors(workers: int | None) -> None:
+    schema = fjson.schema(asset("schemas", "config.json"), dict)
+    paths = [
+        asset("configs", "app.json"),
+        asset("configs", "invalid.json"),
+        asset("configs", "app.txt"),
+        asset("configs", "app.yaml"),
+    ]
+
+    with pytest.raises(fconfig.LoadError) as excinfo:
+        fconfig.load_many(paths, schema, workers=workers)
+
+    assert excinfo.value.results == [DATA, None, None, DATA]
+    assert list(excinfo.value.errors) == paths[1:3]
+    assert isinstance(
+        excinfo.value.errors[paths[1]], jsonschema.ValidationError
+    )
+    assert isinstance(excinfo.value.errors[paths[2]], ValueError)
+    assert str(excinfo.value).startswith("invalid files: ")
@@ -0,0 +1,95 @@
+import configparser
+from typing import Any, Dict
+
+import fini
+import jsonschema
+import pytest
+
+from tests import asset
+
+
+# ################################ FIXTURES ####################################
+
+
+DATA = {
+    "server": {"host": "localhost", "port": 8080, "debug": True, "ratio": 0.5},
+    "paths": {"root": "/srv", "logs": "/srv/logs"},
+}
+
+
+@pytest.fixture(scope="module")
+def schema() -> fini.IniSchema[Dict[str, Any], configparser.ConfigParser]:
+    return fini.schema(asset("schemas", "app.json"), dict)
+
+
+# ################################ LOAD ########################################
+
+
+def test_load(schema: fini.IniSchema[Any, Any]) -> None:
+    path = asset("configs", "app.ini")
+
+    assert fini.load(path, schema, convert=True) == DATA
+    assert fini.load(path, dict)["server"]["port"] == "8080"
+
+
+def test_load_unconverted(schema: fini.IniSchema[Any, Any]) -> None:
+    path = asset("configs", "app.ini")
+
+    with pytest.raises(jsonschema.ValidationError):
+        fini.load(path, schema)
+
+
+def test_load_cache(schema: fini.IniSchema[Any, Any]) -> None:
+    path = asset("configs", "app.ini")
+    fini.clear_caches()
+
+    first = fini.load(path, schema, cache=True, convert=True)
+    first["server"]["port"] = 0
+    second = fini.load(path, schema, cache=True, convert=True)
+
+    assert second == DATA
+
+
+def test_loadp(schema: fini.IniSchema[Any, Any]) -> None:
+    path = asset("configs", "app.ini")
+
+    parser = fini.loadp(path, schema, convert=True)
+    assert parser.getint("server", "port") == 8080
+    assert parser.get("paths", "logs") == "/srv/logs"
+
+    with pytest.raises(jsonschema.ValidationError):
+        fini.loadp(path, schema)
+
+
+# ################################ LOADV #######################################
+
+
+def test_loadv(schema: fini.IniSchema[Any, Any]) -> None:
+    view = fini.loadv(asset("configs", "app.ini"), schema, convert=True)
+
+    assert list(view) == ["server", "paths"]
+    assert "server" in view and "other" not in view
+    assert "port" in view["server"] and "other" not in view["server"]
+    assert {section: dict(view[section]) for section in view} == DATA
+    assert view["server"] is view["server"]
+
+    with pytest.raises(KeyError):
+        view["other"]
+
+
+def test_loadv_lazy(schema: fini.IniSchema[Any, Any]) -> None:
+    view = fini.loadv(asset("configs", "invalid.ini"), schema, convert=True)
+
+    assert len(view) == 2
+    assert "server" in view and "paths" in view
+
+    with pytest.raises(configparser.InterpolationMissingOptionError):
+        view["paths"]
+    with pytest.raises(jsonschema.ValidationError):
+        view["server"]
+
+
+def test_loadv_unvalidated() -> None:
+    view = fini.loadv(asset("configs", "invalid.ini"), dict)
+
+    assert view["server"]["port"] == "http"
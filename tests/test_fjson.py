@@ -0,0 +1,158 @@
+import json
+import os
+import shutil
+from pathlib import Path
+from typing import Any, Dict
+
+import fjson
+import jsonschema
+import pytest
+
+from tests import asset
+
+
+# ################################ FIXTURES ####################################
+
+
+RECORDS = [
+    {"name": "alpha", "port": 1},
+    {"name": "beta", "port": 2, "hosts": ["a", "b"]},
+    {"name": "gamma", "port": 3, "debug": False},
+]
+
+
+@pytest.fixture(scope="module")
+def schema() -> fjson.JsonSchema[Dict[str, Any]]:
+    return fjson.schema(asset("schemas", "config.json"), dict)
+
+
+# ################################ LOAD ########################################
+
+
+@pytest.mark.parametrize("mmap", [False, True])
+def test_load(schema: fjson.JsonSchema[Any], mmap: bool) -> None:
+    data = fjson.load(asset("configs", "valid.json"), schema, mmap=mmap)
+
+    assert data == {
+        "name": "app",
+        "port": 8080,
+        "debug": True,
+        "hosts": ["alpha", "beta"],
+    }
+
+
+def test_load_invalid(schema: fjson.JsonSchema[Any]) -> None:
+    with pytest.raises(jsonschema.ValidationError):
+        fjson.load(asset("configs", "invalid.json"), schema)
+
+    data = fjson.load(asset("configs", "invalid.json"), schema, validate=False)
+    assert data["port"] == 0
+
+
+@pytest.mark.parametrize("mmap", [False, True])
+def test_load_empty(mmap: bool) -> None:
+    with pytest.raises(json.JSONDecodeError):
+        fjson.load(asset("configs", "empty.json"), dict, mmap=mmap)
+
+
+@pytest.mark.parametrize(
+    "s",
+    ['{"value": NaN}', '{"value": 18446744073709551616}', '"\\ud800"'],
+)
+def test_load_fallback(tmp_path: Path, s: str) -> None:
+    path = os.path.join(tmp_path, "value.json")
+    with open(path, "w", encoding="utf-8") as fp:
+        fp.write(s)
+
+    assert repr(fjson.load(path, dict)) == repr(json.loads(s))
+
+
+def test_load_cache(tmp_path: Path, schema: fjson.JsonSchema[Any]) -> None:
+    path = os.path.join(tmp_path, "config.json")
+    shutil.copyfile(asset("configs", "valid.json"), path)
+    fjson.clear_caches()
+
+    first = fjson.load(path, schema, cache=True)
+    first["hosts"].append("gamma")
+    second = fjson.load(path, schema, cache=True)
+    assert second["hosts"] == ["alpha", "beta"]
+
+    with open(path, "w", encoding="utf-8") as fp:
+        json.dump({"name": "other", "port": 1}, fp)
+    os.utime(path, ns=(0, 0))
+    assert fjson.load(path, schema, cache=True)["name"] == "other"
+
+
+# ################################ ILOAD #######################################
+
+
+@pytest.mark.parametrize("workers", [None, 2])
+def test_iload(schema: fjson.JsonSchema[Any], workers: int | None) -> None:
+    path = asset("configs", "records.jsonl")
+
+    assert list(fjson.iload(path, schema, workers=workers)) == RECORDS
+
+
+@pytest.mark.parametrize("chunksize", [1, 3, 7, 1 << 16])
+def test_iload_concatenated(
+    schema: fjson.JsonSchema[Any],
+    monkeypatch: pytest.MonkeyPatch,
+    chunksize: int,
+) -> None:
+    monkeypatch.setattr(fjson, "ILOAD_CHUNK_SIZE", chunksize)
+    path = asset("configs", "records.json")
+
+    assert list(fjson.iload(path, schema, concatenated=True)) == RECORDS
+
+
+@pytest.mark.parametrize("workers", [None, 2])
+def test_iload_invalid(
+    schema: fjson.JsonSchema[Any],
+    workers: int | None,
+) -> None:
+    path = asset("configs", "invalid.jsonl")
+    records = list[Any]()
+    with pytest.raises(jsonschema.ValidationError):
+        for record in fjson.iload(path, schema, workers=workers):
+            records.append(record)
+
+    assert records == [{"name": "alpha", "port": 1}]
+
+
+def test_iload_broken(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(fjson, "ILOAD_CHUNK_SIZE", 4)
+    path = asset("configs", "broken.json")
+
+    values = fjson.iload(path, dict, concatenated=True)
+    assert next(values) == {"name": "alpha", "port": 1}
+    with pytest.raises(json.JSONDecodeError) as excinfo:
+        next(values)
+    assert excinfo.value.msg == "Expecting ',' delimiter"
+
+
+@pytest.mark.parametrize("chunksize", [1, 4, 1 << 16])
+def test_iload_broken_position(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    chunksize: int,
+) -> None:
+    monkeypatch.setattr(fjson, "ILOAD_CHUNK_SIZE", chunksize)
+    path = os.path.join(tmp_path, "values.json")
+    with open(path, "w", encoding="utf-8") as fp:
+        fp.write('{"a": 1}\n{"b": 2} [3]\n  x')
+
+    values = list[Any]()
+    with pytest.raises(json.JSONDecodeError) as excinfo:
+        for value in fjson.iload(path, dict, concatenated=True):
+            values.append(value)
+
+    assert values == [{"a": 1}, {"b": 2}, [3]]
+    assert excinfo.value.pos == 24
+    assert (excinfo.value.lineno, excinfo.value.colno) == (3, 3)
+    assert str(excinfo.value).endswith("line 3 column 3 (char 24)")
+
+
+def test_iload_workers_concatenated() -> None:
+    path = asset("configs", "records.json")
+    with pytest.raises(ValueError):
+        list(fjson.iload(path, dict, concatenated=True, workers=2))
@@ -0,0 +1,60 @@
+import os
+import shutil
+from pathlib import Path
+from typing import Any, Dict
+
+import ftoml
+import jsonschema
+import pytest
+
+from tests import asset
+
+
+# ################################ FIXTURES ####################################
+
+
+@pytest.fixture(scope="module")
+def schema() -> ftoml.TomlSchema[Dict[str, Any]]:
+    return ftoml.schema(asset("schemas", "config.json"), dict)
+
+
+# ################################ LOAD ########################################
+
+
+def test_schema(schema: ftoml.TomlSchema[Any]) -> None:
+    assert schema.validator.schema is schema.decl
+
+
+def test_load(schema: ftoml.TomlSchema[Any]) -> None:
+    data = ftoml.load(asset("configs", "valid.toml"), schema)
+
+    assert data == {
+        "name": "app",
+        "port": 8080,
+        "debug": True,
+        "hosts": ["alpha", "beta"],
+    }
+
+
+def test_load_invalid(schema: ftoml.TomlSchema[Any]) -> None:
+    with pytest.raises(jsonschema.ValidationError):
+        ftoml.load(asset("configs", "invalid.toml"), schema)
+
+    data = ftoml.load(asset("configs", "invalid.toml"), schema, validate=False)
+    assert data["port"] == 0
+
+
+def test_load_cache(tmp_path: Path, schema: ftoml.TomlSchema[Any]) -> None:
+    path = os.path.join(tmp_path, "config.toml")
+    shutil.copyfile(asset("configs", "valid.toml"), path)
+    ftoml.clear_caches()
+
+    first = ftoml.load(path, schema, cache=True)
+    first["hosts"].append("gamma")
+    second = ftoml.load(path, schema, cache=True)
+    assert second["hosts"] == ["alpha", "beta"]
+
+    with open(path, "w", encoding="utf-8") as fp:
+        fp.write('name = "other"\nport = 1\n')
+    os.utime(path, ns=(0, 0))
+    assert ftoml.load(path, schema, cache=True)["name"] == "other"
@@ -0,0 +1,91 @@
+import os
+import shutil
+from pathlib import Path
+from typing import Any, Dict
+
+import fyaml
+import jsonschema
+import pytest
+import yaml
+
+from tests import asset
+
+
+# ################################ FIXTURES ####################################
+
+
+RECORDS = [
+    {"name": "alpha", "port": 1},
+    {"name": "beta", "port": 2, "hosts": ["a", "b"]},
+    {"name": "gamma", "port": 3, "debug": False},
+]
+
+
+@pytest.fixture(scope="module")
+def schema() -> fyaml.YamlSchema[Dict[str, Any]]:
+    return fyaml.schema(asset("schemas", "config.json"), dict)
+
+
+# ################################ LOAD ########################################
+
+
+def test_loader() -> None:
+    assert fyaml.YAML_LOADER in (
+        getattr(yaml, "CSafeLoader", yaml.SafeLoader),
+        yaml.SafeLoader,
+    )
+
+
+def test_load(schema: fyaml.YamlSchema[Any]) -> None:
+    data = fyaml.load(asset("configs", "valid.yaml"), schema)
+
+    assert data == {
+        "name": "app",
+        "port": 8080,
+        "debug": True,
+        "hosts": ["alpha", "beta"],
+    }
+
+
+def test_load_invalid(schema: fyaml.YamlSchema[Any]) -> None:
+    with pytest.raises(jsonschema.ValidationError):
+        fyaml.load(asset("configs", "invalid.yaml"), schema)
+
+    data = fyaml.load(asset("configs", "invalid.yaml"), schema, validate=False)
+    assert data["port"] == 0
+
+
+def test_load_cache(tmp_path: Path, schema: fyaml.YamlSchema[Any]) -> None:
+    path = os.path.join(tmp_path, "config.yaml")
+    shutil.copyfile(asset("configs", "valid.yaml"), path)
+    fyaml.clear_caches()
+
+    first = fyaml.load(path, schema, cache=True)
+    first["hosts"].append("gamma")
+    second = fyaml.load(path, schema, cache=True)
+    assert second["hosts"] == ["alpha", "beta"]
+
+    with open(path, "w", encoding="utf-8") as fp:
+        fp.write("name: other\nport: 1\n")
+    os.utime(path, ns=(0, 0))
+    assert fyaml.load(path, schema, cache=True)["name"] == "other"
+
+
+# ################################ ILOAD #######################################
+
+
+def test_iload(schema: fyaml.YamlSchema[Any]) -> None:
+    path = asset("configs", "records.yaml")
+
+    assert list(fyaml.iload(path, schema)) == RECORDS
+
+
+def test_iload_invalid(schema: fyaml.YamlSchema[Any]) -> None:
+    path = asset("configs", "invalid.records.yaml")
+    records = list[Any]()
+    with pytest.raises(jsonschema.ValidationError):
+        for record in fyaml.iload(path, schema):
+            records.append(record)
+
+    assert records == [{"name": "alpha", "port": 1}]
+    assert len(list(fyaml.iload(path, schema, validate=False))) == 2
@@ -0,0 +1,189 @@
+import hashlib
+import http.server
+import json
+import os.path
+import threading
+from pathlib import Path
+from typing import Iterator, List
+
+import github
+import pytest
+
+from tests import asset
+
+
+# ################################ FIXTURES ####################################
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    requests: List[str] = []
+
+    def do_GET(self) -> None:
+        _Handler.requests.append(self.path)
+
+        file = asset("pages", self.path.strip("/") + ".html")
+        if not os.path.isfile(file):
+            self.send_error(404)
+            return
+
+        with open(file, "rb") as fp:
+            content = fp.read()
+        etag = '"' + hashlib.sha1(content).hexdigest() + '"'
+
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(content)))
+        self.send_header("ETag", etag)
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+@pytest.fixture(scope="module")
+def url() -> Iterator[str]:
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_port}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.fixture(autouse=True)
+def store(tmp_path: Path) -> Iterator[str]:
+    path = os.path.join(tmp_path, "cache")
+    github.configure_cache(path)
+    _Handler.requests.clear()
+    try:
+        yield path
+    finally:
+        github.clear_caches(persistent=True)
+        github.configure_cache(None)
+
+
+# ################################ TESTS #######################################
+
+
+def test_repository(url: str) -> None:
+    repo = github.repository("krnd", "python-collection", url=url)
+
+    assert repo.owner == "krnd"
+    assert repo.name == "python-collection"
+    assert repo.desc == "A collection of Python utility modules."
+    assert repo.license == "MIT"
+    assert repo.stars == 1200
+    assert repo.watchers == 7
+    assert repo.forks == 42
+
+
+def test_repository_missing(url: str) -> None:
+    with pytest.raises(LookupError):
+        github.repository("krnd", "missing", url=url)
+
+
+def test_repository_cached(url: str) -> None:
+    github.repository("krnd", "python-collection", url=url)
+    github.repository("krnd", "python-collection", url=url)
+
+    assert _Handler.requests == ["/krnd/python-collection"]
+
+
+def test_repository_revalidated(url: str) -> None:
+    github.configure_cache(github._store.path, ttl=0.0)
+    first = github.repository("krnd", "python-collection", url=url)
+    second = github.repository("krnd", "python-collection", url=url)
+
+    assert len(_Handler.requests) == 2
+    assert second is first
+
+
+def test_repository_persistent(url: str, store: str) -> None:
+    github.repository("krnd", "python-collection", url=url)
+    github.clear_caches()
+    repo = github.repository("krnd", "python-collection", url=url)
+
+    assert len(_Handler.requests) == 1
+    assert repo.stars == 1200
+    assert os.path.isfile(os.path.join(store, "krnd", "python-collection.json"))
+
+
+def test_repositories(url: str) -> None:
+    results = github.repositories(
+        [("krnd", "python-collection"), ("krnd", "missing")],
+        url=url,
+        concurrency=2,
+    )
+
+    assert isinstance(results[0], github.Repository)
+    assert results[0].forks == 42
+    assert isinstance(results[1], LookupError)
+
+
+def test_export(url: str, tmp_path: Path) -> None:
+    file = os.path.join(tmp_path, "export.jsonl")
+    failures = github.export(
+        ["krnd/python-collection", "krnd/missing"],
+        file,
+        url=url,
+    )
+
+    assert list(failures) == ["krnd/missing"]
+    with open(file, "r", encoding="utf-8") as fp:
+        records = list(map(json.loads, fp))
+    assert [record["name"] for record in records] == ["python-collection"]
+    assert records[0]["license"] == "MIT"
+
+
+def test_export_resume(url: str, tmp_path: Path) -> None:
+    file = os.path.join(tmp_path, "export.csv")
+    github.export(["krnd/python-collection"], file, format="csv", url=url)
+    github.export(["krnd/python-collection"], file, format="csv", url=url)
+
+    with open(file, "r", encoding="utf-8") as fp:
+        assert len(fp.readlines()) == 2
+    assert len(_Handler.requests) == 1
+
+
+def test_clear_caches(store: str) -> None:
+    os.makedirs(os.path.join(store, ".github"))
+    for file in (".github/.github.json", ".github/a.json.1.2.tmp"):
+        open(os.path.join(store, file), "w").close()
+
+    github.clear_caches(persistent=True)
+
+    assert os.listdir(os.path.join(store, ".github")) == []
+
+
+@pytest.mark.parametrize(
+    "key",
+    ["../x", "x/..", "x/y/z", "x/", "/x"],
+)
+def test_store_file_unsafe(key: str) -> None:
+    with pytest.raises(ValueError):
+        github._store.file(key)
+
+
+@pytest.mark.parametrize("name", ["python-collection", "python-monorepo"])
+def test_scrap_sidebar(name: str) -> None:
+    with open(asset("pages", "krnd", f"{name}.html"), "rb") as fp:
+        content = fp.read()
+
+    repos = [
+        github._scrap.repository(
+            "krnd",
+            name,
+            soup=github._scrap.soup(content, sidebar=sidebar),
+        )
+        for sidebar in (False, True)
+    ]
+    assert github._fields(repos[0]) == github._fields(repos[1])
@@ -0,0 +1,133 @@
+import copy
+import glob
+import os
+import pickle
+from pathlib import Path
+from typing import Any, List
+
+import pathutil
+import pytest
+
+
+# ################################ FIXTURES ####################################
+
+
+@pytest.fixture
+def tree(tmp_path: Path) -> str:
+    for index in range(20):
+        for name in ("a.txt", "b.txt", "c.json"):
+            path = os.path.join(tmp_path, f"dir{index:02}", "sub", name)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            open(path, "w").close()
+    return str(tmp_path)
+
+
+# ################################ NORMPATH ####################################
+
+
+@pytest.mark.parametrize(
+    "path, parent",
+    [
+        ("a/b/c.txt", "a/b"),
+        ("c.txt", "."),
+        (".", "."),
+        ("/a/b", "/a"),
+        ("/a", "/"),
+        ("/", "/"),
+    ],
+)
+def test_parent(path: str, parent: str) -> None:
+    assert str(pathutil.NormPath(path).parent()) == parent
+
+
+def test_parent_chain() -> None:
+    path = pathutil.NormPath("a/b/c.txt")
+    for _ in range(5):
+        path = path.parent()
+
+    assert path == pathutil.NormPath(".")
+
+    path = pathutil.NormPath("/a/b")
+    for _ in range(5):
+        path = path.parent()
+
+    assert path == pathutil.NormPath("/")
+    assert pathutil.NormPath("/a").parent() == pathutil.NormPath("/")
+
+
+def test_components() -> None:
+    path = pathutil.NormPath("a/b/c.tar.gz")
+
+    assert path.dirname == "a/b"
+    assert path.basename == "c.tar.gz"
+    assert path.filename == "c.tar"
+    assert path.fileext == ".gz"
+    assert path.replace(fileext=".bz2") == pathutil.NormPath("a/b/c.tar.bz2")
+
+
+def test_immutable() -> None:
+    path = pathutil.NormPath("a/b.txt")
+    paths = {path}
+
+    with pytest.raises(AttributeError):
+        path.path = "c.txt"  # type: ignore
+    with pytest.raises(AttributeError):
+        del path.basename
+
+    assert path in paths
+    assert path.path == "a/b.txt"
+
+
+def test_copy() -> None:
+    path = pathutil.NormPath("a/b.txt")
+
+    assert copy.deepcopy(path) == path
+    assert pickle.loads(pickle.dumps(path)).basename == "b.txt"
+
+
+# ################################ GLOB ########################################
+
+
+@pytest.mark.parametrize(
+    "pattern, recursive",
+    [
+        ("dir*/sub/*.txt", False),
+        ("dir0*/*/c.json", False),
+        ("dir*/**/*.json", True),
+        ("**/*.txt", True),
+        ("dir00/sub/a.txt", False),
+    ],
+)
+@pytest.mark.parametrize("workers", [None, 1, 4])
+def test_glob(
+    tree: str,
+    pattern: str,
+    recursive: bool,
+    workers: int | None,
+) -> None:
+    expected = glob.glob(os.path.join(tree, pattern), recursive=recursive)
+    paths = pathutil.normglob(
+        pattern,
+        basepath=tree,
+        recursive=recursive,
+        workers=workers,
+    )
+
+    assert list(paths) == list(map(os.path.normpath, expected))
+
+
+def test_glob_bounded(tree: str, monkeypatch: pytest.MonkeyPatch) -> None:
+    roots = list[str]()
+    _glob = glob.glob
+
+    def _rootglob(pattern: str, **kwargs: Any) -> List[str]:
+        roots.append(pattern)
+        return _glob(pattern, **kwargs)
+
+    monkeypatch.setattr(glob, "glob", _rootglob)
+    paths = pathutil.inormglob("dir*/sub/*.txt", basepath=tree, workers=2)
+
+    next(paths)
+    assert 0 < len(roots) <= 2 * 2
+    assert len(list(paths)) == 39
+    assert len(roots) == 20